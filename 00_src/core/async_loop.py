@@ -0,0 +1,51 @@
+"""
+async_loop.py
+---
+프로세스 공용 asyncio 이벤트 루프를 백그라운드 데몬 스레드에서 돌린다.
+동기 코드는 run(coro)로 코루틴을 넘기고 결과를 기다린다.
+
+- asyncio.run()처럼 호출마다 루프/셀렉터/기본 executor를 만들고 닫지 않는다.
+- 루프가 하나로 유지되므로 그 루프에 묶인 자원(keep_alive 브라우저의 CDP 연결 등)을 호출 간에 재사용할 수 있다.
+- 호출 측 스레드에 이미 루프가 돌고 있어도(Jupyter 등) 그대로 쓸 수 있다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """백그라운드 루프를 돌려준다 (처음 호출 시 스레드와 함께 생성)."""
+    global _loop, _thread
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(target=_loop.run_forever, name="async-loop", daemon=True)
+            _thread.start()
+        return _loop
+
+
+def run(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """
+    coro를 백그라운드 루프에서 실행하고 결과를 반환 (예외는 그대로 전파).
+    timeout(초)을 넘기거나 호출 측이 중단되면(KeyboardInterrupt 등) 코루틴을 취소한다.
+    백그라운드 루프 안에서 호출하면 교착되므로 RuntimeError.
+    """
+    loop = get_loop()
+    if threading.current_thread() is _thread:
+        coro.close()
+        raise RuntimeError("async_loop.run() called from the loop thread; await the coroutine instead")
+    fut = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return fut.result(timeout)
+    except BaseException:
+        fut.cancel()
+        raise
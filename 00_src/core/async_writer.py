@@ -0,0 +1,93 @@
+"""
+async_writer.py
+---
+캡처 산출물(HTML/TEXT 등) 파일 쓰기를 백그라운드 스레드로 넘긴다.
+노드는 bytes를 큐에 넣고 바로 다음 단계로 넘어가며, 디스크 I/O는 워커 스레드가 처리한다.
+
+- submit(path, data) → concurrent.futures.Future (완료 시 path, 실패 시 예외)
+  실패 로그는 future를 받은 호출 측이 남긴다 (기다리지 않는 작업은 add_done_callback으로)
+- flush(): 지금까지 넣은 작업이 모두 끝날 때까지 대기
+- 각 파일은 {path}.tmp에 쓴 뒤 os.replace로 교체 → 중간에 죽어도 반쯤 쓰인 파일이 남지 않는다.
+- 프로세스 종료 시(atexit) 남은 작업을 비우고 스레드를 닫는다.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Optional
+
+_WRITE_BUFFERING = 1 << 20  # 1 MiB: 큰 HTML도 write 시스템콜 몇 번으로 끝나게
+
+
+class AsyncArtifactWriter:
+    """(path, bytes) 작업을 단일 데몬 스레드에서 순서대로 기록하는 라이터."""
+
+    def __init__(self, buffering: int = _WRITE_BUFFERING) -> None:
+        self._buffering = buffering
+        self._queue: "queue.Queue[Optional[tuple[str, bytes, Future]]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._worker, name="artifact-writer", daemon=True)
+        self._thread.start()
+        self._closed = False
+
+    def submit(self, path: str, data: bytes) -> "Future[str]":
+        """path에 data를 쓰는 작업을 큐에 넣는다. 디렉토리는 호출 측에서 준비."""
+        if self._closed:
+            raise RuntimeError("AsyncArtifactWriter is closed")
+        fut: "Future[str]" = Future()
+        self._queue.put((path, data, fut))
+        return fut
+
+    def flush(self) -> None:
+        """큐에 들어간 작업이 모두 기록될 때까지 블록."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """남은 작업을 기록한 뒤 워커 스레드를 종료."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                path, data, fut = item
+                if not fut.set_running_or_notify_cancel():
+                    continue
+                tmp = f"{path}.tmp"
+                try:
+                    with open(tmp, "wb", buffering=self._buffering) as wf:
+                        wf.write(data)
+                    os.replace(tmp, path)  # 같은 디렉토리 내 rename이라 원자적
+                except BaseException as e:
+                    try:
+                        os.unlink(tmp)
+                    except OSError:
+                        pass
+                    fut.set_exception(e)
+                else:
+                    fut.set_result(path)
+            finally:
+                self._queue.task_done()
+
+
+_writer: Optional[AsyncArtifactWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_writer() -> AsyncArtifactWriter:
+    """프로세스 공용 라이터 (처음 호출 시 생성, 종료 시 자동 close)."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = AsyncArtifactWriter()
+            atexit.register(_writer.close)
+        return _writer
@@ -0,0 +1,153 @@
+"""
+browser_session.py
+---
+순차 실행되는 ingest 에이전트들이 브라우저 하나(keep_alive BrowserSession)를 공유하게 한다.
+호출마다 Chromium 기동 + CDP WebSocket 연결 + 타깃 attach 를 반복하지 않는다.
+
+- get_shared_browser(): 살아 있으면 재사용, 끊겼으면 새로 띄움 (지수 백오프 재시도)
+  확인 → 기동 구간은 루프별 락으로 감싸서 동시 호출이 브라우저를 두 개 띄우지 않는다.
+- shared_browser(): 공유 브라우저를 독점해서 쓰는 async with 블록 (에이전트 실행 + 캡처 동안 잡는다)
+- is_browser_connected(): Target.getTargets 핑(1초 타임아웃)으로 연결 확인
+- close_shared_browser(): 명시적 종료 (안 불러도 인터프리터 종료 시 atexit 훅이 닫는다)
+
+주의: CDP 연결은 만든 이벤트 루프에 묶인다. 다른 루프에서 호출되면 기존 세션은 버리고 새로 만든다.
+동시에 여러 에이전트를 돌릴 때는 공유하지 말 것 (에이전트별 세션 사용).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import random
+import weakref
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Optional
+
+if TYPE_CHECKING:
+    from browser_use import BrowserSession
+
+logger = logging.getLogger(__name__)
+
+_START_ATTEMPTS = 3
+_BACKOFF_BASE_SEC = 1.0
+_BACKOFF_MAX_SEC = 5.0
+_PING_TIMEOUT_SEC = 1.0
+
+_session: Optional["BrowserSession"] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+_atexit_registered = False
+
+# asyncio.Lock은 처음 쓴 루프에 묶이므로 루프별로 따로 둔다
+_start_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+_use_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+
+def _loop_lock(locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]") -> asyncio.Lock:
+    loop = asyncio.get_running_loop()
+    lock = locks.get(loop)
+    if lock is None:
+        lock = locks[loop] = asyncio.Lock()
+    return lock
+
+
+async def is_browser_connected(session: "BrowserSession") -> bool:
+    """CDP 루트 클라이언트에 가벼운 요청을 보내 연결이 살아 있는지 확인."""
+    try:
+        await asyncio.wait_for(session.cdp_client.send.Target.getTargets(), timeout=_PING_TIMEOUT_SEC)
+        return True
+    except Exception:
+        return False
+
+
+async def _start_with_backoff() -> "BrowserSession":
+    from browser_use import BrowserSession
+
+    for attempt in range(_START_ATTEMPTS):
+        session = BrowserSession(keep_alive=True)
+        try:
+            await session.start()
+            return session
+        except Exception as e:
+            # 반쯤 뜬 Chromium이 남지 않도록 정리 후 재시도
+            try:
+                await session.kill()
+            except Exception:
+                pass
+            if attempt == _START_ATTEMPTS - 1:
+                raise
+            delay = min(_BACKOFF_BASE_SEC * 2**attempt + random.random() * 0.25, _BACKOFF_MAX_SEC)
+            logger.warning("browser start failed (%s), retry in %.2fs", e, delay)
+            await asyncio.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+async def get_shared_browser() -> "BrowserSession":
+    """현재 이벤트 루프에서 쓸 공유 BrowserSession을 돌려준다."""
+    async with _loop_lock(_start_locks):
+        return await _get_or_start()
+
+
+async def _get_or_start() -> "BrowserSession":
+    global _session, _session_loop, _atexit_registered
+    loop = asyncio.get_running_loop()
+
+    if _session is not None:
+        if _session_loop is loop and await is_browser_connected(_session):
+            return _session
+        if _session_loop is loop:
+            # 같은 루프인데 연결이 끊김 → 정리 후 재연결
+            logger.warning("shared browser disconnected, reconnecting")
+            try:
+                await _session.kill()
+            except Exception:
+                pass
+        # 다른 루프에서 만든 세션은 여기서 await 할 수 없으므로 버린다
+        _session, _session_loop = None, None
+
+    _session = await _start_with_backoff()
+    _session_loop = loop
+    if not _atexit_registered:
+        atexit.register(_close_at_exit)
+        _atexit_registered = True
+    return _session
+
+
+@asynccontextmanager
+async def shared_browser() -> AsyncIterator["BrowserSession"]:
+    """
+    공유 브라우저를 블록 동안 독점한다. 포커스된 탭 하나를 쓰므로
+    두 에이전트가 동시에 조작하지 않도록 같은 루프의 다른 사용자는 블록이 끝날 때까지 기다린다.
+    """
+    async with _loop_lock(_use_locks):
+        yield await get_shared_browser()
+
+
+async def close_shared_browser() -> None:
+    """공유 브라우저를 종료한다 (같은 루프에서 호출해야 함)."""
+    global _session, _session_loop
+    async with _loop_lock(_start_locks):
+        if _session is None:
+            return
+        session, _session, _session_loop = _session, None, None
+    try:
+        await session.kill()
+    except Exception:
+        logger.exception("shared browser kill failed")
+
+
+def _close_at_exit() -> None:
+    """
+    인터프리터 종료 시 남은 공유 브라우저를 만든 루프에서 닫는다 (keep_alive라 안 닫으면 Chromium이 남는다).
+    async_loop의 백그라운드 루프라면 데몬 스레드가 아직 살아 있으므로 그 루프로 넘긴다.
+    """
+    loop = _session_loop
+    if _session is None or loop is None or loop.is_closed():
+        return
+    try:
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(close_shared_browser(), loop).result(timeout=10)
+        else:
+            loop.run_until_complete(close_shared_browser())
+    except Exception:
+        logger.exception("shared browser close at exit failed")
@@ -0,0 +1,113 @@
+"""
+content_cache.py
+---
+캡처 산출물을 내용 해시로 중복 제거한다.
+같은 검색 결과 페이지를 다시 캡처하면(디버깅/재시도 시 흔함) 새 파일을 쓰지 않고 기존 경로를 돌려준다.
+
+- 1단계: 프로세스 내 dict (digest → path)
+- 2단계: 디스크 인덱스 파일 (한 줄에 "hexdigest<TAB>path", append-only)
+  로드할 때 줄 수가 항목 수의 2배를 넘으면 최신 매핑만 남기고 다시 쓴다 (compact)
+- 해시: hashlib.blake2b(digest_size=16) — 표준 라이브러리, 추가 의존성 없음
+
+인덱스에 있어도 파일이 지워졌으면 miss로 본다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+_DIGEST_SIZE = 16
+_COMPACT_MIN_LINES = 1024  # 이보다 작은 인덱스는 압축하지 않는다
+
+
+def content_digest(data: bytes) -> bytes:
+    """data의 128비트 blake2b 다이제스트."""
+    return hashlib.blake2b(data, digest_size=_DIGEST_SIZE).digest()
+
+
+class ContentCache:
+    """digest → 저장 경로 매핑 (인덱스 파일은 처음 조회할 때 한 번만 읽는다)."""
+
+    def __init__(self, index_path: str) -> None:
+        self.index_path = index_path
+        self._index: Optional[Dict[bytes, str]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[bytes, str]:
+        if self._index is not None:
+            return self._index
+        index: Dict[bytes, str] = {}
+        lines = 0
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    lines += 1
+                    hexd, sep, path = line.rstrip("\n").partition("\t")
+                    if not sep:
+                        continue
+                    try:
+                        index[bytes.fromhex(hexd)] = path
+                    except ValueError:
+                        continue  # 깨진 줄은 무시
+        except FileNotFoundError:
+            pass
+        self._index = index
+        if lines >= _COMPACT_MIN_LINES and lines > 2 * len(index):
+            self._compact_locked(index)
+        return index
+
+    def _compact_locked(self, index: Dict[bytes, str]) -> None:
+        """지워진 파일 항목을 빼고 인덱스 파일을 원자적으로 다시 쓴다 (self._lock 보유 상태)."""
+        for digest in [d for d, p in index.items() if not os.path.exists(p)]:
+            del index[digest]
+        tmp = f"{self.index_path}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.writelines(f"{d.hex()}\t{p}\n" for d, p in index.items())
+            os.replace(tmp, self.index_path)
+        except OSError:
+            # 다시 쓰기에 실패해도 기존 인덱스는 그대로 유효하다
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+    def compact(self) -> int:
+        """중복 줄과 지워진 파일 항목을 정리한다. 남은 항목 수를 돌려준다."""
+        with self._lock:
+            index = self._load()
+            self._compact_locked(index)
+            return len(index)
+
+    def lookup(self, data: bytes) -> Tuple[bytes, Optional[str]]:
+        """(digest, 기존 경로 또는 None). 기존 파일이 남아 있을 때만 경로를 돌려준다."""
+        digest = content_digest(data)
+        with self._lock:
+            path = self._load().get(digest)
+        if path is not None and not os.path.exists(path):
+            return digest, None
+        return digest, path
+
+    def record(self, digest: bytes, path: str) -> None:
+        """저장이 끝난 파일을 인덱스에 추가 (메모리 + 디스크 append)."""
+        with self._lock:
+            self._load()[digest] = path
+            os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(f"{digest.hex()}\t{path}\n")
+
+
+_caches: Dict[str, ContentCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_content_cache(index_path: str) -> ContentCache:
+    """index_path별 공용 ContentCache."""
+    with _caches_lock:
+        cache = _caches.get(index_path)
+        if cache is None:
+            cache = _caches[index_path] = ContentCache(index_path)
+        return cache
@@ -0,0 +1,26 @@
+"""
+env.py
+---
+.env 로딩을 프로세스당 한 번만 수행한다.
+노드 모듈이 import/reload 될 때마다 .env 파일을 다시 찾고 파싱하지 않도록 sentinel로 막는다.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from dotenv import load_dotenv
+
+_loaded = False
+_lock = threading.Lock()
+
+
+def init_env() -> None:
+    """처음 호출될 때만 load_dotenv() 실행 (이미 설정된 환경변수는 덮어쓰지 않음)."""
+    global _loaded
+    if _loaded:
+        return
+    with _lock:
+        if not _loaded:
+            load_dotenv()
+            _loaded = True
@@ -1,4 +1,3 @@
-# 00_src/core/llm_factory.py
 from __future__ import annotations
 """
 LLM 팩토리: 설정/환경변수로 ChatOpenAI 생성
@@ -8,18 +7,68 @@ LLM 팩토리: 설정/환경변수로 ChatOpenAI 생성
 """
 
 import os
-from typing import Optional
-from browser_use import ChatOpenAI
+import tomllib
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from browser_use import ChatOpenAI
+
+_DEFAULT_MODEL = "gpt-5-mini"
+_SETTINGS_TOML = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "configs", "settings.toml"
+)  # 00_src/configs/settings.toml
+
+
+@lru_cache(maxsize=8)
+def _load_settings_cached(path: str, mtime_ns: int) -> dict[str, Any]:
+    """settings.toml 파싱 결과를 (경로, mtime) 키로 캐시. 파일이 바뀌면 키가 달라져 재파싱."""
+    # 파일 핸들에서 조각조각 읽지 않고 한 번에 읽어 문자열로 파싱
+    return tomllib.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def _read_settings_model(default: str = _DEFAULT_MODEL) -> str:
+    """configs/settings.toml 의 [llm].model 값을 읽는다. 파일이 없거나 깨져 있으면 default."""
+    # exists() 사전 검사 없이 stat 한 번으로 존재 확인 + 캐시 키 획득.
+    # stat 이후 파일이 사라져도 read 쪽 FileNotFoundError로 같은 경로를 탄다.
+    try:
+        data = _load_settings_cached(_SETTINGS_TOML, os.stat(_SETTINGS_TOML).st_mtime_ns)
+    except FileNotFoundError:
+        return default
+    except Exception:
+        # TOML 문법 오류 등
+        return default
+    return data.get("llm", {}).get("model", default)
+
+
+@lru_cache(maxsize=1)
+def _env_settings() -> tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    LLM_MODEL / LLM_API_KEY / LLM_BASE_URL 스냅샷.
+    import 시점이 아니라 첫 호출 시점에 읽는다 (호출 측 load_dotenv() 이후여야 .env 값이 보임).
+    """
+    return os.getenv("LLM_MODEL"), os.getenv("LLM_API_KEY"), os.getenv("LLM_BASE_URL")
+
+
+def reset_env_cache() -> None:
+    """환경변수를 바꾼 뒤(테스트 등) 다시 읽게 한다."""
+    _env_settings.cache_clear()
+
 
 def llm_from_settings() -> ChatOpenAI:
     """
     환경변수/설정으로 ChatOpenAI 인스턴스 생성.
-    - LLM_MODEL: 모델 이름 (예: 'gpt-4o-mini', 'gpt-4o', 'gpt-5' 등)
+    - LLM_MODEL: 모델 이름 (예: 'gpt-4o-mini', 'gpt-4o', 'gpt-5' 등), 없으면 settings.toml [llm].model
     - LLM_API_KEY: OpenAI 호환 키 (없으면 기존 방식)
+    - LLM_BASE_URL: OpenAI 호환 엔드포인트 (없으면 기본값)
     """
-    model = os.getenv("LLM_MODEL", "gpt-5-mini")
-    api_key: Optional[str] = os.getenv("LLM_API_KEY")
+    # browser_use/openai SDK 임포트는 무거워서 실제로 LLM이 필요할 때만 로드
+    from browser_use import ChatOpenAI
+
+    env_model, api_key, base_url = _env_settings()
+    model = env_model or _read_settings_model()
 
     # if api_key:
-    return ChatOpenAI(model=model, api_key=api_key)
-    # return ChatOpenAI(model=model)
\ No newline at end of file
+    return ChatOpenAI(model=model, api_key=api_key, base_url=base_url)
+    # return ChatOpenAI(model=model)
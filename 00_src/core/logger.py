@@ -9,19 +9,16 @@ from __future__ import annotations
 import logging, os
 from logging.handlers import RotatingFileHandler
 
-def get_logger(
-    name: str = "agent",
-    log_dir: str = "00_src/logs",
-    level: int = logging.INFO,
-) -> logging.Logger:
-    os.makedirs(log_dir, exist_ok=True)
+# log_dir별 핸들러 캐시: 세션마다 로거 이름이 달라도 graph.log 파일 핸들은 하나만 연다
+_handlers: dict[str, tuple[logging.Handler, ...]] = {}
 
-    logger = logging.getLogger(name)
-    if logger.handlers:
-        # 이미 초기화된 로거 재사용
-        return logger
 
-    logger.setLevel(level)
+def _shared_handlers(log_dir: str) -> tuple[logging.Handler, ...]:
+    handlers = _handlers.get(log_dir)
+    if handlers is not None:
+        return handlers
+
+    os.makedirs(log_dir, exist_ok=True)
 
     fmt = logging.Formatter(
         "%(asctime)s.%(msecs)03d [%(levelname)s] %(name)s - %(message)s",
@@ -39,7 +36,22 @@ def get_logger(
     stream = logging.StreamHandler()
     stream.setFormatter(fmt)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(stream)
+    handlers = _handlers[log_dir] = (file_handler, stream)
+    return handlers
+
+
+def get_logger(
+    name: str = "agent",
+    log_dir: str = "00_src/logs",
+    level: int = logging.INFO,
+) -> logging.Logger:
+    logger = logging.getLogger(name)
+    if logger.handlers:
+        # 이미 초기화된 로거 재사용
+        return logger
+
+    logger.setLevel(level)
+    for handler in _shared_handlers(log_dir):
+        logger.addHandler(handler)
 
-    return logger
\ No newline at end of file
+    return logger
@@ -0,0 +1,34 @@
+"""
+yaml_cache.py
+---
+설정 YAML(catalog_index.yaml 등)을 (경로, mtime, 크기) 키로 캐시해서 읽는다.
+파일이 그대로면 stat 한 번 + dict 조회로 끝나고, 수정되면 mtime/크기가 바뀌어 자동으로 다시 파싱한다.
+(mtime 해상도가 거친 파일시스템에서 같은 시각에 두 번 저장돼도 크기가 다르면 잡아낸다)
+
+파싱 결과는 캐시에만 두고 호출 측에는 깊은 복사본을 준다 (복사는 파싱보다 훨씬 싸다).
+호출 측이 반환값을 고쳐도 다음 조회가 오염되지 않는다.
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+from functools import lru_cache
+from typing import Any
+
+import yaml
+
+# 캐시 miss 때만 파싱하므로 로더 선택은 import 시 한 번: libyaml 바인딩이 없는 PyYAML 빌드면 SafeLoader로 대체
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=16)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_Loader)
+
+
+def load_yaml(path: str) -> Any:
+    """path의 YAML을 파싱해서 반환 (mtime/크기가 같으면 캐시 재사용). 파일이 없으면 FileNotFoundError."""
+    st = os.stat(path)
+    return copy.deepcopy(_load_yaml_cached(path, st.st_mtime_ns, st.st_size))
@@ -15,17 +15,16 @@ ingest_catalog node: navigate catalog index, search, then SAVE LOCALLY (no agent
 """
 import os
 import sys
+import re
 import json
 import time
 import uuid
-import yaml
 import asyncio
 import logging
 import datetime
 from typing import Any, Iterable, List, Optional
 from contextlib import contextmanager
 from browser_use import Agent, ChatOpenAI
-from dotenv import load_dotenv
 
 # ── logger import (패키지 경로 문제가 있을 수 있어, 안전하게 sys.path 보강)
 _THIS_DIR = os.path.dirname(__file__)
@@ -33,8 +32,12 @@ _PKG_ROOT = os.path.abspath(os.path.join(_THIS_DIR, ".."))  # 00_src/
 if _PKG_ROOT not in sys.path:
     sys.path.append(_PKG_ROOT)
 from core.logger import get_logger  # 00_src/core/logger.py
+from core.yaml_cache import load_yaml  # 00_src/core/yaml_cache.py
+from core.async_loop import run as run_in_loop  # 00_src/core/async_loop.py
+from core.env import init_env  # 00_src/core/env.py
+from core.async_writer import get_writer  # 00_src/core/async_writer.py
 
-load_dotenv()
+init_env()
 
 # ── 스텝 타이머 컨텍스트: 시작/종료/예외를 모두 파일 로그에 남긴다
 @contextmanager
@@ -51,38 +54,71 @@ def step(logger: logging.Logger, name: str):
         raise
 
 
+class _Leave:
+    """_flatten_strings 스택 표시: 이 객체의 하위 순회가 끝났다 (현재 경로에서 뺀다)."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self.obj = obj  # 순회가 끝날 때까지 살려 둬야 id가 재사용되지 않는다
+
+
 def _flatten_strings(x: Any) -> List[str]:
-    """✅ NEW: 임의의 중첩 구조에서 문자열만 납작하게 수집."""
+    """✅ NEW: 임의의 중첩 구조에서 문자열만 납작하게 수집 (재귀 대신 명시적 스택, 순서는 깊이 우선 그대로).
+    같은 객체가 여러 번 나오면 매번 펼치고, 순환 참조만 끊는다 (현재 경로에 있는 객체만 기억)."""
     out: List[str] = []
-    if x is None:
-        return out
-    if isinstance(x, str):
-        out.append(x)
-        return out
-    if isinstance(x, (list, tuple, set)):
-        for v in x:
-            out.extend(_flatten_strings(v))
-        return out
-    if isinstance(x, dict):
-        for v in x.values():
-            out.extend(_flatten_strings(v))
-        return out
-    # pydantic 객체나 임의 객체일 수 있음 → dict로 시도
-    try:
-        d = x.dict()  # pydantic BaseModel
-        out.extend(_flatten_strings(d))
-    except Exception:
-        # asdict/fallback
-        try:
-            out.extend(_flatten_strings(vars(x)))
-        except Exception:
-            pass
+    append = out.append
+    stack: List[Any] = [x]
+    pop = stack.pop
+    push = stack.extend
+    on_path: set[int] = set()
+    while stack:
+        v = pop()
+        t = type(v)
+        if t is str:
+            append(v)
+        elif v is None:
+            continue
+        elif t is list or t is tuple:
+            push(reversed(v))
+        elif t is dict:
+            push(reversed(v.values()))
+        elif t is _Leave:
+            on_path.discard(id(v.obj))
+        elif isinstance(v, str):
+            append(v)  # str 하위 클래스(StrEnum 등)
+        elif id(v) in on_path:
+            continue  # 자기 자신을 다시 가리킴 → 순환
+        else:
+            on_path.add(id(v))
+            stack.append(_Leave(v))
+            if isinstance(v, (list, tuple, set)):
+                push(reversed(list(v)))
+            elif isinstance(v, dict):
+                push(reversed(list(v.values())))
+            else:
+                # pydantic 객체나 임의 객체일 수 있음 → dict로 시도
+                try:
+                    push((v.dict(),))  # pydantic BaseModel
+                except Exception:
+                    # asdict/fallback
+                    try:
+                        push((vars(v),))
+                    except Exception:
+                        pass
     return out
 
 
+# '<html' 대소문자 무시 검색 (후보마다 lstrip()/lower() 사본을 만들지 않음)
+_HTML_RE = re.compile(r"<html", re.IGNORECASE)
+_HTML_SNIFF_LEN = 4096  # outerHTML이면 '<html'은 맨 앞에 있으므로 앞부분만 검사
+# json.dumps(..., ensure_ascii=False)는 호출마다 인코더를 새로 만든다 → 하나를 재사용
+_JSONL_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
 def _pick_html_text(candidates: Iterable[str]) -> tuple[Optional[str], Optional[str]]:
     """✅ NEW: 문자열들 중에서 HTML/텍스트 1개씩 고른다.
-    - HTML: '<html' 포함(대/소문자 무시), 길이 가장 긴 것
+    - HTML: 앞 4KB에 '<html' 포함(대/소문자 무시), 길이 가장 긴 것
     - TEXT: '<html' 미포함, 길이 가장 긴 것
     """
     html_best = None
@@ -92,15 +128,18 @@ def _pick_html_text(candidates: Iterable[str]) -> tuple[Optional[str], Optional[
     for s in candidates:
         if not isinstance(s, str):
             continue
-        s_clean = s.lstrip()
-        if "<html" in s_clean.lower():
-            if len(s) > maxh:
+        n = len(s)
+        # 어느 쪽 최장값도 못 넘는 후보는 분류(정규식)할 필요 없음 (중복 후보가 많음)
+        if n <= maxh and n <= maxt:
+            continue
+        if _HTML_RE.search(s, 0, _HTML_SNIFF_LEN):
+            if n > maxh:
                 html_best = s
-                maxh = len(s)
+                maxh = n
         else:
-            if len(s) > maxt:
+            if n > maxt:
                 text_best = s
-                maxt = len(s)
+                maxt = n
     return html_best, text_best
 
 
@@ -125,8 +164,7 @@ def run_ingest(place: str, title: str, watchdog_sec: int = 300) -> None:
     # 1) 설정 로드: load config file and validate place key
     with step(logger, "load_config"):
         cfg_path = os.path.join(_PKG_ROOT, "configs", "catalog_index.yaml")
-        with open(cfg_path, "r", encoding="utf-8") as f:
-            index = yaml.safe_load(f)
+        index = load_yaml(cfg_path)  # mtime 캐시 (core/yaml_cache.py)
         key = place.lower()
         if key not in index:
             raise KeyError(f"place '{place}' not found in catalog_index.yaml keys={list(index.keys())}")
@@ -186,12 +224,8 @@ STEPS
     # 4) 에이전트 실행 및 watchdog 적용, 비동기 처리
     with step(logger, f"agent_run.watchdog({watchdog_sec}s)"):
         try:
-            try:
-                loop = asyncio.get_running_loop()
-                task = loop.create_task(_run_agent())
-                history = loop.run_until_complete(asyncio.wait_for(task, timeout=watchdog_sec))
-            except RuntimeError:
-                history = asyncio.run(asyncio.wait_for(_run_agent(), timeout=watchdog_sec))
+            # 공용 백그라운드 루프에서 실행 (호출마다 asyncio.run()으로 루프를 새로 만들지 않음)
+            history = run_in_loop(asyncio.wait_for(_run_agent(), timeout=watchdog_sec))
         except asyncio.TimeoutError:
             logger.error(f"watchdog timeout ({watchdog_sec}s) → agent task cancelled")
         except KeyboardInterrupt:
@@ -221,18 +255,25 @@ STEPS
                         action_history = history.model_actions()
                 except Exception:
                     action_history = []
-            with open(dump_path, "w", encoding="utf-8") as wf:
-                if isinstance(action_history, list):
-                    for item in action_history:
+            # 줄마다 write 하지 않고 한 번에 모아서 바이너리로 기록
+            lines: List[str] = []
+            if isinstance(action_history, list):
+                encode = _JSONL_ENCODER.encode
+                for item in action_history:
+                    try:
+                        lines.append(encode(item))
+                    except Exception:
+                        # 객체면 dict로 변환 시도
                         try:
-                            wf.write(json.dumps(item, ensure_ascii=False) + "\n")
+                            lines.append(encode(item.__dict__))
                         except Exception:
-                            # 객체면 dict로 변환 시도
-                            try:
-                                wf.write(json.dumps(item.__dict__, ensure_ascii=False) + "\n")
-                            except Exception:
-                                pass
-            logger.info(f"dumped action history → {dump_path}")
+                            pass
+            # 디버그 덤프는 결과와 무관하므로 기다리지 않는다 (실패는 콜백에서 로그)
+            payload = ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+            get_writer().submit(dump_path, payload).add_done_callback(
+                lambda f: f.exception() and logger.error(f"history dump failed: {f.exception()!r}")
+            )
+            logger.info(f"queued action history dump → {dump_path}")
         except Exception:
             logger.exception("history dump failed")
 
@@ -284,39 +325,35 @@ STEPS
         # ✅ NEW: 선택 로직
         html_val, text_val = _pick_html_text(candidates)
 
-        # 저장
-        saved_html = False
-        saved_text = False
-        try:
-            if html_val:
-                os.makedirs(os.path.dirname(html_path), exist_ok=True)
-                with open(html_path, "w", encoding="utf-8") as wf:
-                    wf.write(html_val)
-                saved_html = True
-                logger.info(f"saved HTML → {html_path}")
-            else:
-                logger.warning("no HTML candidate found")
-        except Exception:
-            logger.exception("save HTML failed")
-
-        try:
-            if text_val:
-                os.makedirs(os.path.dirname(text_path), exist_ok=True)
-                with open(text_path, "w", encoding="utf-8") as wf:
-                    wf.write(text_val)
-                saved_text = True
-                logger.info(f"saved TEXT → {text_path}")
-            else:
-                logger.warning("no TEXT candidate found")
-        except Exception:
-            logger.exception("save TEXT failed")
+        # 저장: 한 번만 인코딩한 bytes를 백그라운드 라이터에 넘기고, 결과는 finalize에서 확인
+        writer = get_writer()
+        pending: List[tuple[str, str, int, Any]] = []  # (label, path, 바이트 수, future)
+        for label, val, path in (("HTML", html_val, html_path), ("TEXT", text_val, text_path)):
+            if not val:
+                logger.warning(f"no {label} candidate found")
+                continue
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                payload = val.encode("utf-8")
+                pending.append((label, path, len(payload), writer.submit(path, payload)))
+            except Exception:
+                logger.exception(f"save {label} failed")
 
     # 6) 최종 확인 및 로그 기록
     with step(logger, "finalize"):
-        exists_html = os.path.exists(html_path)
-        exists_text = os.path.exists(text_path)
-        logger.info(f"files_exist html={exists_html} text={exists_text}")
-        if exists_html and exists_text:
+        # 라이터 결과로 저장 여부 판단 (exists()로 다시 stat 하지 않음)
+        saved = set()
+        for label, path, size, fut in pending:
+            try:
+                fut.result()
+            except Exception:
+                logger.exception(f"save {label} failed")
+            else:
+                saved.add(label)
+                logger.info(f"saved {label} → {path} ({size} bytes)")
+        saved_html, saved_text = "HTML" in saved, "TEXT" in saved
+        logger.info(f"files_exist html={saved_html} text={saved_text}")
+        if saved_html and saved_text:
             logger.info(f"✅ Saved raw HTML/Text → {os.path.dirname(html_path)}/")
         else:
             logger.warning("⚠️ Files missing (one or both). Check previous steps/logs.")
@@ -5,80 +5,110 @@ from __future__ import annotations
 ingest_catalog_v2: 최소 구현의 '수집(ingest)' 노드
 
 - LangChain/LangGraph 미사용. browser_use.Agent + LLM 팩토리만 사용.
-- 에이전트는: 카탈로그 홈 → 검색 → HTML/TEXT evaluate → done
-- 파이썬이 에이전트 히스토리에서 문자열 후보를 모아 HTML/TEXT를 선택 저장.
+- 에이전트는: 카탈로그 홈 → 검색 → done
+- 에이전트 종료 후 파이썬이 같은 브라우저에서 HTML/TEXT를 CDP evaluate 한 번으로 함께 회수해 저장.
+  (캡처 실패 시 로그만 남기고 저장하지 않음)
 - 과도한 예외처리 제거, 필수 경로/로그만 남김.
 - 스크린샷/어댑티브 대기 없음. (빠르게 끝내는 목적)
 
 입출력
 - 입력: place(예: "gangnam"), title(예: "숨결이 바람 될 때")
 - 출력: 00_src/data/raw/YYYY-MM-DD/{place}_{epoch}.html / .txt
+  (이미 저장된 내용과 같으면 새로 쓰지 않고 기존 파일을 이 경로에 하드링크)
+  같은 place가 같은 초에 여러 번 저장되면(배치 실행) 두 번째부터 {place}_{epoch}_{n} (n=2, 3, ...)
 """
 
 import os
 import sys
+import re
 import json
 import time
 import uuid
-import yaml
+import shutil
 import asyncio
 import datetime
+from functools import lru_cache
 from typing import Any, List, Optional
 
-from dotenv import load_dotenv
-from browser_use import Agent
 # LLM은 팩토리로 교체 가능 (환경변수/설정으로 모델 스위치)
 from core.llm_factory import llm_from_settings
 from core.logger import get_logger  # 세션별 로그 파일 생성
+from core.yaml_cache import load_yaml  # 설정 YAML mtime 캐시
+from core.async_writer import get_writer  # 산출물 파일 쓰기 (백그라운드 스레드)
+from core.browser_session import close_shared_browser, shared_browser  # keep_alive 브라우저 재사용
+from core.content_cache import get_content_cache  # 내용 해시로 중복 저장 방지
+from core.async_loop import run as run_in_loop  # 동기 진입점 → 공용 백그라운드 이벤트 루프
+from core.env import init_env  # .env 로딩 (프로세스당 1회)
+
+init_env()
+
+# ---- 경로 상수: import 시 한 번만 계산 ----------------------------------------
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))  # 00_src/
+_CATALOG_INDEX_PATH = os.path.join(_ROOT, "configs", "catalog_index.yaml")
+_RAW_ROOT = os.path.join(_ROOT, "data", "raw")
+_HASH_INDEX_PATH = os.path.join(_RAW_ROOT, ".hash_index")
+
+# ---- 유틸: 문자열 펼치기 ---------------------------------
+class _Leave:
+    """_flatten_strings 스택 표시: 이 객체의 하위 순회가 끝났다 (현재 경로에서 뺀다)."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self.obj = obj  # 순회가 끝날 때까지 살려 둬야 id가 재사용되지 않는다
 
-load_dotenv()
 
-# ---- 유틸: 문자열 펼치기 / HTML·TEXT 고르기 ---------------------------------
 def _flatten_strings(x: Any, out: Optional[List[str]] = None) -> List[str]:
-    """중첩 자료구조에서 문자열만 추출."""
+    """
+    중첩 자료구조에서 문자열만 추출.
+    재귀 대신 명시적 스택으로 순회하고(순서는 깊이 우선 그대로), 흔한 타입은 type() 비교로 먼저 처리한다.
+    같은 객체가 여러 번 나오면 매번 펼친다. 순환 참조만 끊도록 현재 경로에 있는 객체만 기억한다.
+    """
     if out is None:
         out = []
-    if x is None:
-        return out
-    if isinstance(x, str):
-        out.append(x)
-        return out
-    if isinstance(x, (list, tuple, set)):
-        for v in x:
-            _flatten_strings(v, out)
-        return out
-    if isinstance(x, dict):
-        for v in x.values():
-            _flatten_strings(v, out)
-        return out
-    # pydantic/임의 객체 최소 대응
-    if hasattr(x, "dict"):
-        try:
-            _flatten_strings(x.dict(), out)  # type: ignore
-            return out
-        except Exception:
-            pass
-    if hasattr(x, "__dict__"):
-        try:
-            _flatten_strings(vars(x), out)
-        except Exception:
-            pass
-    return out
-
-
-def _pick_html_text(cands: List[str]) -> tuple[Optional[str], Optional[str]]:
-    """후보 중 HTML(‘<html’)과 TEXT(그 외) 최장 문자열 각각 선택."""
-    html_val, text_val = None, None
-    maxh, maxt = -1, -1
-    for s in cands:
-        sc = s.lstrip()
-        if "<html" in sc.lower():
-            if len(s) > maxh:
-                html_val, maxh = s, len(s)
+    append = out.append
+    stack: List[Any] = [x]
+    pop = stack.pop
+    push = stack.extend
+    on_path: set[int] = set()
+    while stack:
+        v = pop()
+        t = type(v)
+        if t is str:
+            append(v)
+        elif v is None:
+            continue
+        elif t is list or t is tuple:
+            push(reversed(v))
+        elif t is dict:
+            push(reversed(v.values()))
+        elif t is _Leave:
+            on_path.discard(id(v.obj))
+        elif isinstance(v, str):
+            append(v)  # str 하위 클래스(StrEnum 등)
+        elif id(v) in on_path:
+            continue  # 자기 자신을 다시 가리킴 → 순환
         else:
-            if len(s) > maxt:
-                text_val, maxt = s, len(s)
-    return html_val, text_val
+            on_path.add(id(v))
+            stack.append(_Leave(v))
+            if isinstance(v, (list, tuple, set)):
+                push(reversed(list(v)))
+            elif isinstance(v, dict):
+                push(reversed(list(v.values())))
+            else:
+                # pydantic/임의 객체 최소 대응
+                if hasattr(v, "dict"):
+                    try:
+                        push((v.dict(),))  # type: ignore
+                        continue
+                    except Exception:
+                        pass
+                if hasattr(v, "__dict__"):
+                    try:
+                        push((vars(v),))
+                    except Exception:
+                        pass
+    return out
 
 
 def _load_catalog_index(place: str) -> dict[str, Any]:
@@ -94,10 +124,8 @@ def _load_catalog_index(place: str) -> dict[str, Any]:
     Raises:
     - KeyError if the place is not found in the catalog index.
     """
-    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    cfg_path = os.path.join(root, "configs", "catalog_index.yaml")
-    with open(cfg_path, "r", encoding="utf-8") as f: # what is f here? file object
-        index = yaml.safe_load(f) # data type of index: dict[str, Any]
+    # mtime 기반 캐시: 같은 프로세스에서 반복 호출해도 파일이 그대로면 재파싱하지 않음
+    index = load_yaml(_CATALOG_INDEX_PATH) # data type of index: dict[str, Any]
     key = place.lower()
     if key not in index:
         raise KeyError(f"place '{place}' not found in catalog_index.yaml")
@@ -105,104 +133,162 @@ def _load_catalog_index(place: str) -> dict[str, Any]:
     return info
 
 
+# ---- 출력 경로 캐시: 같은 날 배치 실행 시 join/makedirs 반복 방지 ----------------
+_mkdir_cache: set[str] = set()
+_out_dir_cache: tuple[str, str] = ("", "")  # (today, out_dir)
+_reserved_bases: set[str] = set()  # 현재 초(_reserved_sec)에 이미 배정한 파일명 베이스
+_reserved_sec = 0
+
+
+def _ensure_dir(p: str) -> None:
+    """이미 만든 디렉토리는 다시 makedirs 하지 않는다."""
+    if p not in _mkdir_cache:
+        os.makedirs(p, exist_ok=True)
+        _mkdir_cache.add(p)
+
+
+def _link_existing(src: str, dst: str) -> None:
+    """dedup 히트: 기존 파일을 이번 실행 경로에 하드링크한다 (다른 파일시스템 등으로 안 되면 복사)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _forget_dir(p: str) -> None:
+    """실행 중에 디렉토리가 지워졌을 때(FileNotFoundError) _ensure_dir가 다시 만들도록 캐시에서 뺀다."""
+    _mkdir_cache.discard(p)
+
+
 def _prepare_output_paths(place: str) -> tuple[str, str, str]:
     """
     Prepare output directory and file paths for saving HTML and TEXT files.
+    The directory itself is created lazily at save time (see _ensure_dir).
     
     Parameters:
     - place: The place string used as part of the filename.
     
     Returns:
+    (basename은 {place}_{epoch}, 같은 초에 이미 배정됐으면 {place}_{epoch}_{n})
     - out_dir: The output directory path.
     - html_path: The full path to save the HTML file.
     - txt_path: The full path to save the TEXT file.
     """
-    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    today = str(datetime.date.today())
-    out_dir = os.path.join(root, "data", "raw", today)
-    os.makedirs(out_dir, exist_ok=True)
-    base = f"{place}_{int(time.time())}"
+    global _out_dir_cache, _reserved_sec
+    today = datetime.date.today().isoformat()
+    if _out_dir_cache[0] != today:
+        _out_dir_cache = (today, os.path.join(_RAW_ROOT, today))
+    out_dir = _out_dir_cache[1]
+    sec = int(time.time())
+    if sec != _reserved_sec:
+        # 베이스에 초 단위 epoch가 들어가므로 지난 초의 예약은 다시 겹칠 일이 없다
+        _reserved_bases.clear()
+        _reserved_sec = sec
+    base = f"{place}_{sec}"
+    # 배치 실행 시 같은 place가 같은 초에 겹칠 수 있어 접미사로 구분
+    if base in _reserved_bases:
+        n = 2
+        while f"{base}_{n}" in _reserved_bases:
+            n += 1
+        base = f"{base}_{n}"
+    _reserved_bases.add(base)
     html_path = os.path.join(out_dir, f"{base}.html")
     txt_path = os.path.join(out_dir, f"{base}.txt")
     return out_dir, html_path, txt_path
 
 
-# def _build_agent_task(homepage: str, search_box: list[str], submit_btn: list[str], title: str) -> str:
-#     """
-#     Construct the deterministic web agent task script for browsing and scraping.
-    
-#     Parameters:
-#     - homepage: The homepage URL to navigate to.
-#     - search_box: List of CSS selectors for search input boxes.
-#     - submit_btn: List of CSS selectors for submit buttons.
-#     - title: The search query string to input.
-    
-#     Returns:
-#     - A string containing the multiline agent task instructions.
-#     """
-#     task = f"""
-# You are a deterministic web agent. Do NOT take screenshots. Keep output short.
-# Run each step EXACTLY once. Do NOT retry evaluate even if empty.
-
-# 1) navigate: {homepage}
-
-# 2) evaluate (find & submit once):
-#    (function(){{
-#      const inputs = {json.dumps(search_box)};
-#      const buttons = {json.dumps(submit_btn)};
-#      let usedInput = null, usedButton = null;
-#      // input
-#      for (const sel of inputs) {{
-#        const el = document.querySelector(sel);
-#        if (el) {{ el.focus(); el.value = {json.dumps(title)}; el.dispatchEvent(new Event('input',{{bubbles:true}})); usedInput = sel; break; }}
-#      }}
-#      // submit
-#      for (const sel of buttons) {{
-#        const el = document.querySelector(sel);
-#        if (el) {{ try{{ el.click(); usedButton = sel; }}catch(_){{}} break; }}
-#      }}
-#      if (!usedButton && usedInput) {{
-#        const el = document.querySelector(usedInput);
-#        if (el) el.dispatchEvent(new KeyboardEvent('keydown', {{key:'Enter',bubbles:true}}));
-#        usedButton = 'ENTER';
-#      }}
-#      return JSON.stringify({{input:usedInput, button:usedButton}});
-#    }})()
-
-# 3) evaluate HTML ONCE (no retry):
-#    (function(){{
-#      try {{
-#        const html = document.documentElement ? document.documentElement.outerHTML : '';
-#        return html ? html.slice(0, 10000) : '';
-#      }} catch (e) {{
-#        return 'ERROR:' + e.message;
-#      }}
-#    }})()
-
-# 4) evaluate TEXT ONCE (no retry):
-#    (function(){{
-#      try {{
-#        const t = document.body ? document.body.innerText : '';
-#        return t ? t.slice(0, 10000) : '';
-#      }} catch (e) {{
-#        return 'ERROR:' + e.message;
-#      }}
-#    }})()
-
-# 5) done: "ok"
-# """.strip()
-#     return task
-
-
-
-def _run_agent(task: str, timeout_sec: int, logger) -> Any:
+@lru_cache(maxsize=64)
+def _build_agent_task(homepage: str, search_box: tuple[str, ...], submit_btn: tuple[str, ...], title: str) -> str:
+    """
+    Construct the deterministic web agent task script for browsing and searching.
+    HTML/TEXT 평가는 에이전트에게 맡기지 않고, 실행이 끝난 뒤 _capture_page가 CDP로 직접 수행한다.
+    같은 (place, title) 재시도/배치에서는 캐시된 문자열을 재사용한다 (인자는 해시 가능한 tuple).
+
+    Parameters:
+    - homepage: The homepage URL to navigate to.
+    - search_box: Tuple of CSS selectors for search input boxes.
+    - submit_btn: Tuple of CSS selectors for submit buttons.
+    - title: The search query string to input.
+
+    Returns:
+    - A string containing the multiline agent task instructions.
+    """
+    task = f"""
+You are a deterministic web agent. Do NOT take screenshots. Keep output short.
+Run each step EXACTLY once.
+
+1) navigate: {homepage}
+
+2) evaluate (find & submit once):
+   (function(){{
+     const inputs = {json.dumps(search_box)};
+     const buttons = {json.dumps(submit_btn)};
+     let usedInput = null, usedButton = null;
+     // input
+     for (const sel of inputs) {{
+       const el = document.querySelector(sel);
+       if (el) {{ el.focus(); el.value = {json.dumps(title)}; el.dispatchEvent(new Event('input',{{bubbles:true}})); usedInput = sel; break; }}
+     }}
+     // submit
+     for (const sel of buttons) {{
+       const el = document.querySelector(sel);
+       if (el) {{ try{{ el.click(); usedButton = sel; }}catch(_){{}} break; }}
+     }}
+     if (!usedButton && usedInput) {{
+       const el = document.querySelector(usedInput);
+       if (el) el.dispatchEvent(new KeyboardEvent('keydown', {{key:'Enter',bubbles:true}}));
+       usedButton = 'ENTER';
+     }}
+     return JSON.stringify({{input:usedInput, button:usedButton}});
+   }})()
+
+3) wait until the search result page has loaded, then done: "ok"
+""".strip()
+    return task
+
+
+# ---- 결과 페이지 캡처: 에이전트 종료 후 CDP로 직접 evaluate ---------------------------
+# 결정적인 단계라 LLM을 거치지 않는다. 렌더러는 스크립트를 어차피 순서대로 실행하므로
+# HTML/TEXT를 한 번의 evaluate로 [outerHTML, innerText] 배열로 받아 왕복/직렬화를 한 번으로 줄인다.
+_CAPTURE_JS = (
+    "(() => [document.documentElement ? document.documentElement.outerHTML : '',"
+    " document.body ? document.body.innerText : ''])()"
+)
+_CAPTURE_TIMEOUT_SEC = 30
+
+
+async def _capture_page(browser_session: Any, logger) -> tuple[Optional[str], Optional[str]]:
+    """
+    현재 탭의 outerHTML / innerText를 Runtime.evaluate 한 번으로 함께 가져온다 (같은 DOM 시점).
+
+    Returns:
+    - (html, text). 비어 있으면 None.
+    """
+    cdp_session = await browser_session.get_or_create_cdp_session(focus=False)
+    res = await asyncio.wait_for(
+        cdp_session.cdp_client.send.Runtime.evaluate(
+            params={"expression": _CAPTURE_JS, "returnByValue": True}, session_id=cdp_session.session_id
+        ),
+        timeout=_CAPTURE_TIMEOUT_SEC,
+    )
+    if "exceptionDetails" in res:
+        raise RuntimeError(f"evaluate failed: {res['exceptionDetails']}")
+    html_val, text_val = res.get("result", {}).get("value") or ("", "")
+    html_val, text_val = html_val or None, text_val or None
+    logger.info("captured via CDP: html=%d chars, text=%d chars", len(html_val or ""), len(text_val or ""))
+    return html_val, text_val
+
+
+
+async def _arun_agent(task: str, timeout_sec: int, logger, browser_session: Any = None) -> Any:
     """
-    Run the Agent asynchronously with a timeout and return the history object.
+    Run the Agent with a timeout inside the caller's event loop and return the history object.
     
     Parameters:
     - task: The agent task script string.
     - timeout_sec: Timeout in seconds for the agent run.
     - logger: Logger instance for logging progress and errors.
+    - browser_session: 재사용할 BrowserSession (None이면 에이전트가 자체 브라우저를 띄움)
     
     Returns:
     - The history object returned by the agent.
@@ -210,8 +296,11 @@ def _run_agent(task: str, timeout_sec: int, logger) -> Any:
     Raises:
     - Exception if the agent run fails or times out.
     """
+    # browser_use.Agent는 브라우저/DOM/LLM 스택 전체를 끌고 오므로 실행 시점에 임포트
+    from browser_use import Agent
+
     llm = llm_from_settings()
-    agent = Agent(task=task, llm=llm)
+    agent = Agent(task=task, llm=llm, browser_session=browser_session)
 
     async def _run():
         logger.info("agent.run() start")
@@ -220,110 +309,213 @@ def _run_agent(task: str, timeout_sec: int, logger) -> Any:
         return h
 
     try:
-        history = asyncio.run(asyncio.wait_for(_run(), timeout=timeout_sec))
+        history = await asyncio.wait_for(_run(), timeout=timeout_sec)
     except Exception as e:
-        logger.error(f"agent error: {e}")
+        logger.error("agent error: %s", e)
         raise
     return history
 
 
+# ---- 셀렉터 결과 로깅 함수 ---------------------------------
+_JSON_OBJ_RE = re.compile(r"\s*\{")
 
-def _extract_candidates(history: Any) -> List[str]:
-    """
-    Extract string candidates from the agent's history object to find HTML and TEXT.
-    """
-    cands: List[str] = []
-    if hasattr(history, "action_results"):
-        cands = _flatten_strings(history.action_results())  # type: ignore
-    if not cands and hasattr(history, "model_outputs"):
-        cands = _flatten_strings(history.model_outputs())   # type: ignore
-    if not cands and hasattr(history, "final_result"):
-        cands = _flatten_strings(history.final_result())    # type: ignore
-    return cands
 
-# ---- 셀렉터 결과 로깅 함수 ---------------------------------
 def _log_selector_result(history, logger):
     """
     history에서 {"input":..., "button":...} 형태의 JSON 문자열을 찾아 logger.info로 출력.
     """
     cands = _flatten_strings(history)
     for s in cands:
-        if not isinstance(s, str):
+        # JSON 객체로 시작하지 않는 문자열(HTML/TEXT 등 큰 후보 포함)은 파싱 시도 자체를 생략
+        if not isinstance(s, str) or not _JSON_OBJ_RE.match(s):
             continue
         try:
             obj = json.loads(s)
         except Exception:
             continue
         if isinstance(obj, dict) and "input" in obj and "button" in obj:
-            logger.info(f"[selector result] input: {obj['input']!r}, button: {obj['button']!r}")
+            logger.info("[selector result] input: %r, button: %r", obj["input"], obj["button"])
             # 여러 개 있을 경우 첫 것만 로그
             break
 
 
-def run_ingest_v2(place: str, title: str, timeout_sec: int = 180) -> None:
+async def _run_and_capture(
+    task: str, timeout_sec: int, logger, browser_session: Any
+) -> tuple[Optional[str], Optional[str]]:
+    """에이전트로 검색까지 진행한 뒤 같은 브라우저에서 결과 페이지를 캡처한다. 캡처 실패 시 (None, None)."""
+    history = await _arun_agent(task, timeout_sec, logger, browser_session)
+    # Log selector result if available
+    _log_selector_result(history, logger)
+    try:
+        return await _capture_page(browser_session, logger)
+    except Exception as e:
+        # 히스토리에는 HTML/TEXT가 없으므로(태스크가 평가하지 않음) 대체 소스 없이 실패로 처리
+        logger.error("page capture failed: %s", e)
+        return None, None
+
+
+async def arun_ingest_v2(place: str, title: str, timeout_sec: int = 180, reuse_browser: bool = True) -> bool:
     """
-    Main function to run the ingest process:
-    - Load catalog index info for the place.
-    - Prepare output paths.
-    - Build agent task script.
-    - Run the agent to get browsing history.
-    - Extract HTML and TEXT from history and save them.
-    
-    Parameters:
-    - place: catalog_index.yaml의 키 (예: 'gangnam')
-    - title: 검색어 (예: '숨결이 바람 될 때')
-    - timeout_sec: Agent 실행 타임아웃(초)
+    Async version of run_ingest_v2, usable from a running event loop (e.g. arun_many_v2).
+    Parameters are the same as run_ingest_v2, plus:
+    - reuse_browser: True면 공유 keep_alive 브라우저(core.browser_session)에서 실행.
+      동시에 여러 건을 돌릴 때는 False (건별 브라우저).
+      True인 동시 호출은 에이전트 실행 + 캡처 단위로 순서대로 처리된다.
+
+    Returns:
+    - True if both HTML and TEXT files exist at html_path / txt_path
+      (새로 쓰였거나, 같은 내용의 기존 파일이 링크됨).
     """
     # Initialize logger and session ID
     session_id = uuid.uuid4().hex[:8]
     logger = get_logger(f"ingest_v2_{session_id}")
-    logger.info(f"[SESSION {session_id}] start | place={place} title={title!r} timeout={timeout_sec}s")
+    logger.info("[SESSION %s] start | place=%s title=%r timeout=%ss", session_id, place, title, timeout_sec)
 
     # Load catalog index information
     info = _load_catalog_index(place)
     homepage: str = info["homepage"]
     search_box: list[str] = info["search_box"]
     submit_btn: list[str] = info["submit_btn"]
-    logger.info(f"homepage={homepage} box={search_box} btn={submit_btn}")
+    logger.info("homepage=%s box=%s btn=%s", homepage, search_box, submit_btn)
 
     # Prepare output file paths
     out_dir, html_path, txt_path = _prepare_output_paths(place)
-    logger.info(f"→ will save HTML: {html_path}")
-    logger.info(f"→ will save TEXT: {txt_path}")
+    logger.info("→ will save HTML: %s", html_path)
+    logger.info("→ will save TEXT: %s", txt_path)
 
     # Build agent task string
-    task = _build_agent_task(homepage, search_box, submit_btn, title)
+    task = _build_agent_task(homepage, tuple(search_box), tuple(submit_btn), title)
 
-    # Run the agent and get history
-    history = _run_agent(task, timeout_sec, logger)
+    # Run the agent (navigate + search) and capture the result page directly.
+    if reuse_browser:
+        # 공유 브라우저는 탭 하나를 쓰므로 에이전트 실행 + 캡처 동안 독점 (동기 호출이 여러 스레드에서 와도 순서대로)
+        async with shared_browser() as browser_session:
+            html_val, text_val = await _run_and_capture(task, timeout_sec, logger, browser_session)
+    else:
+        # 건별 실행도 keep_alive 세션을 직접 만들어야 에이전트 종료 후 캡처할 수 있다.
+        from browser_use import BrowserSession
 
-    # Extract candidate strings from history
-    cands = _extract_candidates(history)
-    # Log selector result if available
-    _log_selector_result(history, logger)
+        browser_session = BrowserSession(keep_alive=True)
+        try:
+            html_val, text_val = await _run_and_capture(task, timeout_sec, logger, browser_session)
+        finally:
+            await browser_session.kill()
+
+    # 같은 내용이 이미 저장돼 있으면 다시 쓰지 않고 기존 파일을 이번 경로에 링크 (출력 경로 규약 유지)
+    # 인덱스 읽기/추가는 블로킹 파일 I/O라 이벤트 루프 밖(to_thread)에서 한다
+    cache = get_content_cache(_HASH_INDEX_PATH)
+    writer = get_writer()
+    saved: List[str] = []
+    pending = []  # (digest, 경로, bytes, future)
+
+    for label, val, path in (("HTML", html_val, html_path), ("TEXT", text_val, txt_path)):
+        if not val:
+            logger.warning("no %s captured", label)
+            continue
+        data = val.encode("utf-8")
+        digest, hit = await asyncio.to_thread(cache.lookup, data)
+        # 실제로 남길 파일이 있을 때만 날짜 디렉토리 생성
+        _ensure_dir(out_dir)
+        if hit:
+            try:
+                await asyncio.to_thread(_link_existing, hit, path)
+            except OSError as e:
+                logger.warning("dedup link failed for %s (%s), writing instead", label, e)
+            else:
+                # 최신 경로로 갱신해 두면 오래된 날짜 디렉토리를 지워도 히트가 유지된다
+                await asyncio.to_thread(cache.record, digest, path)
+                saved.append(path)
+                logger.info("dedup-hit %s → %s (linked from %s)", label, path, hit)
+                continue
+        # 파일 쓰기는 백그라운드 라이터로 넘기고, 끝에서 한꺼번에 기다린다
+        pending.append((digest, path, data, writer.submit(path, data)))
+
+    results = await asyncio.gather(*(asyncio.wrap_future(f) for *_, f in pending), return_exceptions=True)
+    for i, res in enumerate(results):
+        if isinstance(res, FileNotFoundError):
+            # 에이전트 실행 중에 날짜 디렉토리가 지워짐 → 다시 만들고 한 번만 재시도 (이번 캡처를 버리지 않음)
+            _, path, data, _ = pending[i]
+            logger.warning("output dir missing, re-creating and retrying: %s", path)
+            _forget_dir(out_dir)
+            _ensure_dir(out_dir)
+            try:
+                results[i] = await asyncio.wrap_future(writer.submit(path, data))
+            except Exception as e:
+                results[i] = e
+
+    # 저장한 경로를 그 자리에서 기록 (끝에서 exists()로 다시 stat 하지 않음)
+    for (digest, _, data, _), res in zip(pending, results):
+        if isinstance(res, BaseException):
+            logger.error("save failed: %s", res)
+        else:
+            await asyncio.to_thread(cache.record, digest, res)
+            saved.append(res)
+            logger.info("saved → %s (%d bytes)", res, len(data))
 
-    # Pick HTML and TEXT from candidates
-    html_val, text_val = _pick_html_text(cands)
+    ok = len(saved) == 2
+    logger.info("done: ok=%s dir=%s", ok, out_dir)
+    return ok
 
-    # Save HTML if exists
-    if html_val:
-        with open(html_path, "w", encoding="utf-8") as wf:
-            wf.write(html_val)
-        logger.info(f"saved HTML → {html_path}")
-    else:
-        logger.warning("no HTML captured")
 
-    # Save TEXT if exists
-    if text_val:
-        with open(txt_path, "w", encoding="utf-8") as wf:
-            wf.write(text_val)
-        logger.info(f"saved TEXT → {txt_path}")
-    else:
-        logger.warning("no TEXT captured")
+def run_ingest_v2(place: str, title: str, timeout_sec: int = 180) -> bool:
+    """
+    Main function to run the ingest process:
+    - Load catalog index info for the place.
+    - Prepare output paths.
+    - Build agent task script.
+    - Run the agent to navigate and search.
+    - Capture HTML and TEXT of the result page via CDP and save them.
+
+    Parameters:
+    - place: catalog_index.yaml의 키 (예: 'gangnam')
+    - title: 검색어 (예: '숨결이 바람 될 때')
+    - timeout_sec: Agent 실행 타임아웃(초)
+
+    Returns:
+    - True if both HTML and TEXT files were saved, False otherwise (캡처/저장 실패는 로그에 남음).
+    """
+    return run_in_loop(arun_ingest_v2(place, title, timeout_sec))
 
-    ok = os.path.exists(html_path) and os.path.exists(txt_path)
-    logger.info(f"done: ok={ok} dir={out_dir}")
+
+async def arun_many_v2(
+    items: List[tuple[str, str]], timeout_sec: int = 180, max_concurrency: int = 3
+) -> List[bool]:
+    """
+    (place, title) 목록을 동시에 수집한다. 각 건은 독립된 에이전트/브라우저로 돌기 때문에
+    전체 소요 시간이 합(sum)이 아니라 대략 가장 느린 건(max)에 가까워진다.
+
+    Parameters:
+    - items: [(place, title), ...]
+    - timeout_sec: 건별 Agent 실행 타임아웃(초)
+    - max_concurrency: 동시에 띄울 브라우저 수 상한
+
+    Returns:
+    - items 순서대로 ok 여부. 예외로 실패한 건은 False.
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def _one(place: str, title: str) -> bool:
+        async with sem:
+            # 동시 실행은 브라우저를 공유하지 않는다
+            return await arun_ingest_v2(place, title, timeout_sec, reuse_browser=False)
+
+    results = await asyncio.gather(*(_one(p, t) for p, t in items), return_exceptions=True)
+    for (place, title), r in zip(items, results):
+        if isinstance(r, BaseException):
+            get_logger("ingest_v2_batch").error(
+                "ingest raised: place=%s title=%r: %r", place, title, r, exc_info=r
+            )
+    return [r is True for r in results]
+
+
+def run_many_v2(items: List[tuple[str, str]], timeout_sec: int = 180, max_concurrency: int = 3) -> List[bool]:
+    """arun_many_v2의 동기 래퍼."""
+    return run_in_loop(arun_many_v2(items, timeout_sec, max_concurrency))
 
 if __name__ == "__main__":
     # 예시 실행
-    run_ingest_v2("songpa", "숨결이 바람 될 때", timeout_sec=180)
\ No newline at end of file
+    try:
+        run_ingest_v2("songpa", "숨결이 바람 될 때", timeout_sec=180)
+    finally:
+        # keep_alive 공유 브라우저는 직접 닫아야 프로세스 종료 후 남지 않는다
+        run_in_loop(close_shared_browser())
\ No newline at end of file
@@ -0,0 +1,11 @@
+"""
+00_src 단위 테스트 공용 설정.
+앱 코드는 `from core.X import ...`로 import 하므로 00_src를 sys.path에 넣는다.
+"""
+
+import os
+import sys
+
+_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
@@ -0,0 +1,61 @@
+"""core.async_loop: 결과/예외 전파, 타임아웃 시 취소, 루프 스레드 안 호출 거부."""
+
+import asyncio
+import concurrent.futures
+import threading
+
+import pytest
+from core import async_loop
+
+
+def test_run_returns_result():
+    async def add(a, b):
+        await asyncio.sleep(0)
+        return a + b
+
+    assert async_loop.run(add(1, 2)) == 3
+
+
+def test_run_propagates_exception():
+    async def boom():
+        raise KeyError("x")
+
+    with pytest.raises(KeyError):
+        async_loop.run(boom())
+
+
+def test_run_reuses_one_loop():
+    async def current():
+        return asyncio.get_running_loop()
+
+    assert async_loop.run(current()) is async_loop.run(current()) is async_loop.get_loop()
+
+
+def test_timeout_cancels_coroutine():
+    cancelled = threading.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(concurrent.futures.TimeoutError):
+        async_loop.run(slow(), timeout=0.05)
+    assert cancelled.wait(5)
+
+
+def test_run_from_loop_thread_raises():
+    async def nested():
+        inner = asyncio.sleep(0)
+        try:
+            async_loop.run(inner)
+        except RuntimeError as e:
+            # 거부된 코루틴은 닫혀 있어야 한다 ("never awaited" 경고 없음)
+            return e, inner.cr_frame is None
+        return None, False
+
+    err, closed = async_loop.run(nested(), timeout=5)
+    assert isinstance(err, RuntimeError)
+    assert closed
@@ -0,0 +1,57 @@
+"""core.async_writer: tmp → os.replace 원자적 교체와 실패 시 tmp 정리."""
+
+import os
+
+import pytest
+from core.async_writer import AsyncArtifactWriter
+
+
+@pytest.fixture
+def writer():
+    w = AsyncArtifactWriter()
+    yield w
+    w.close()
+
+
+def test_write_replaces_atomically(tmp_path, writer):
+    path = tmp_path / "a.html"
+    path.write_bytes(b"old")
+
+    assert writer.submit(str(path), b"new").result(timeout=5) == str(path)
+    assert path.read_bytes() == b"new"
+    assert os.listdir(tmp_path) == ["a.html"]  # .tmp가 남지 않음
+
+
+def test_missing_parent_dir_raises(tmp_path, writer):
+    path = tmp_path / "gone" / "a.html"
+
+    with pytest.raises(FileNotFoundError):
+        writer.submit(str(path), b"x").result(timeout=5)
+    assert not (tmp_path / "gone").exists()
+
+
+def test_replace_failure_unlinks_tmp(tmp_path, writer):
+    # 대상이 디렉토리면 tmp 쓰기는 성공하고 os.replace에서 실패한다
+    path = tmp_path / "a.html"
+    path.mkdir()
+
+    with pytest.raises(OSError):
+        writer.submit(str(path), b"x").result(timeout=5)
+    assert os.listdir(tmp_path) == ["a.html"]
+    assert path.is_dir()
+
+
+def test_flush_waits_for_queued_writes(tmp_path, writer):
+    futs = [writer.submit(str(tmp_path / f"{i}.txt"), b"%d" % i) for i in range(20)]
+    writer.flush()
+
+    assert all(f.done() for f in futs)
+    assert sorted(os.listdir(tmp_path)) == sorted(f"{i}.txt" for i in range(20))
+
+
+def test_submit_after_close_raises(tmp_path):
+    w = AsyncArtifactWriter()
+    w.close()
+
+    with pytest.raises(RuntimeError):
+        w.submit(str(tmp_path / "a.html"), b"x")
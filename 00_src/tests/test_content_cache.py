@@ -0,0 +1,77 @@
+"""core.content_cache: 디스크 인덱스 재로딩, 지워진 파일 miss, 압축."""
+
+from core import content_cache
+from core.content_cache import ContentCache, content_digest
+
+
+def _write(path, data: bytes) -> str:
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_lookup_miss_then_hit(tmp_path):
+    cache = ContentCache(str(tmp_path / "idx"))
+    digest, hit = cache.lookup(b"page")
+    assert hit is None
+    assert digest == content_digest(b"page")
+
+    saved = _write(tmp_path / "a.html", b"page")
+    cache.record(digest, saved)
+    assert cache.lookup(b"page") == (digest, saved)
+
+
+def test_index_reloaded_from_disk(tmp_path):
+    index = str(tmp_path / "sub" / "idx")  # 상위 디렉토리도 record가 만든다
+    saved = _write(tmp_path / "a.html", b"page")
+    ContentCache(index).record(content_digest(b"page"), saved)
+
+    # 새 인스턴스 = 새 프로세스: 메모리 dict 없이 인덱스 파일에서 읽는다
+    assert ContentCache(index).lookup(b"page")[1] == saved
+
+
+def test_deleted_file_is_a_miss(tmp_path):
+    index = str(tmp_path / "idx")
+    saved = _write(tmp_path / "a.html", b"page")
+    ContentCache(index).record(content_digest(b"page"), saved)
+    (tmp_path / "a.html").unlink()
+
+    assert ContentCache(index).lookup(b"page")[1] is None
+
+
+def test_corrupt_lines_are_skipped(tmp_path):
+    index = tmp_path / "idx"
+    saved = _write(tmp_path / "a.html", b"page")
+    index.write_text(
+        f"no-tab-line\nzz\t{tmp_path / 'x'}\n{content_digest(b'page').hex()}\t{saved}\n",
+        encoding="utf-8",
+    )
+
+    assert ContentCache(str(index)).lookup(b"page")[1] == saved
+
+
+def test_load_compacts_duplicate_lines(tmp_path, monkeypatch):
+    monkeypatch.setattr(content_cache, "_COMPACT_MIN_LINES", 4)
+    index = tmp_path / "idx"
+    saved = _write(tmp_path / "a.html", b"page")
+    digest = content_digest(b"page")
+    cache = ContentCache(str(index))
+    for _ in range(5):
+        cache.record(digest, saved)
+    cache.record(content_digest(b"gone"), str(tmp_path / "gone.html"))
+
+    reloaded = ContentCache(str(index))
+    assert reloaded.lookup(b"page")[1] == saved
+    # 최신 매핑 하나만 남고, 지워진 파일 항목은 빠진다
+    assert index.read_text(encoding="utf-8") == f"{digest.hex()}\t{saved}\n"
+    assert not (tmp_path / "idx.tmp").exists()
+
+
+def test_compact_drops_missing_files(tmp_path):
+    index = tmp_path / "idx"
+    cache = ContentCache(str(index))
+    keep = _write(tmp_path / "a.html", b"a")
+    cache.record(content_digest(b"a"), keep)
+    cache.record(content_digest(b"b"), str(tmp_path / "b.html"))
+
+    assert cache.compact() == 1
+    assert index.read_text(encoding="utf-8") == f"{content_digest(b'a').hex()}\t{keep}\n"
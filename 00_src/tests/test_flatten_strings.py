@@ -0,0 +1,58 @@
+"""_flatten_strings (v1/v2): 재귀 구현과 같은 출력 + 순환 참조에서 멈춤."""
+
+import enum
+import importlib
+
+import pytest
+
+pytest.importorskip("yaml")
+pytest.importorskip("dotenv")
+
+
+@pytest.fixture(params=["nodes.ingest_catalog_v2", "nodes.ingest_catalog"])
+def flatten(request):
+    try:
+        module = importlib.import_module(request.param)
+    except ImportError as e:  # v1은 import 시 browser_use가 필요
+        pytest.skip(f"{request.param}: {e}")
+    return module._flatten_strings
+
+
+class S(str, enum.Enum):
+    A = "a"
+
+
+class Obj:
+    def __init__(self, **kw):
+        self.__dict__.update(kw)
+
+
+class Model:
+    """pydantic BaseModel처럼 .dict()를 가진 객체."""
+
+    def __init__(self, **kw):
+        self._kw = kw
+
+    def dict(self):
+        return dict(self._kw)
+
+
+def test_nested_order_is_depth_first(flatten):
+    data = ["a", ("b", {"k": ["c", None, 1]}), {"d"}, Model(x="e", y=[Obj(z="f")]), "g"]
+    assert flatten(data) == ["a", "b", "c", "d", "e", "f", "g"]
+
+
+def test_str_subclass_repeats_are_kept(flatten):
+    assert flatten([S.A, S.A, "z"]) == [S.A, S.A, "z"]
+
+
+def test_shared_object_is_walked_every_time(flatten):
+    o = Obj(p="x", q="y")
+    assert flatten([o, o]) == ["x", "y", "x", "y"]
+
+
+def test_cycle_through_object_terminates(flatten):
+    o = Obj(name="n")
+    o.me = o
+    o.items = [o, "t"]
+    assert flatten([o, o]) == ["n", "t", "n", "t"]
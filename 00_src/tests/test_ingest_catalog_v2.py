@@ -0,0 +1,138 @@
+"""nodes.ingest_catalog_v2: 에이전트/브라우저 없이 저장 경로(arun_ingest_v2 후반부)만 검증."""
+
+import contextlib
+import logging
+import shutil
+
+import pytest
+
+pytest.importorskip("yaml")
+pytest.importorskip("dotenv")
+
+from core import async_loop
+from nodes import ingest_catalog_v2 as v2
+
+HTML = "<html><body>결과</body></html>"
+TEXT = "결과"
+
+
+@pytest.fixture
+def ingest(tmp_path, monkeypatch):
+    """
+    _RAW_ROOT/.hash_index를 tmp_path로 돌리고, 에이전트 실행과 캡처를 가짜로 바꾼다.
+    captured["value"]를 바꾸면 다음 실행의 캡처 결과가 바뀐다.
+    """
+    captured = {"value": (HTML, TEXT)}
+
+    async def fake_agent(task, timeout_sec, logger, browser_session=None):
+        return None
+
+    async def fake_capture(browser_session, logger):
+        return captured["value"]
+
+    @contextlib.asynccontextmanager
+    async def fake_browser():
+        yield object()
+
+    monkeypatch.setattr(v2, "_RAW_ROOT", str(tmp_path / "raw"))
+    monkeypatch.setattr(v2, "_HASH_INDEX_PATH", str(tmp_path / "raw" / ".hash_index"))
+    monkeypatch.setattr(v2, "_out_dir_cache", ("", ""))
+    monkeypatch.setattr(v2, "_mkdir_cache", set())
+    monkeypatch.setattr(v2, "_load_catalog_index", lambda place: {"homepage": "https://x", "search_box": ["#q"], "submit_btn": ["#go"]})
+    monkeypatch.setattr(v2, "_arun_agent", fake_agent)
+    monkeypatch.setattr(v2, "_capture_page", fake_capture)
+    monkeypatch.setattr(v2, "shared_browser", fake_browser)
+    monkeypatch.setattr(v2, "get_logger", logging.getLogger)
+
+    def run(place="songpa"):
+        return async_loop.run(v2.arun_ingest_v2(place, "제목", timeout_sec=5), timeout=10)
+
+    run.captured = captured
+    return run
+
+
+def _out_dir(tmp_path):
+    (day,) = [p for p in (tmp_path / "raw").iterdir() if p.is_dir()]
+    return day
+
+
+def test_recreates_dated_dir_removed_between_runs(tmp_path, ingest):
+    assert ingest() is True
+    day = _out_dir(tmp_path)
+    shutil.rmtree(day)
+
+    # mkdir 캐시에는 남아 있지만 저장 시 FileNotFoundError → 디렉토리를 다시 만들고 재시도
+    ingest.captured["value"] = ("<html>다른 결과</html>", "다른 결과")
+    assert ingest() is True
+    assert len(list(day.glob("*.html"))) == 1
+    assert len(list(day.glob("*.txt"))) == 1
+
+
+def test_dedup_hit_links_into_this_runs_paths(tmp_path, ingest):
+    assert ingest() is True
+    assert ingest() is True
+
+    day = _out_dir(tmp_path)
+    first, second = sorted(day.glob("*.html"), key=lambda p: len(p.name))
+    # 같은 내용이면 새로 쓰지 않고 기존 파일을 하드링크 → 두 실행 모두 자기 경로에 파일이 있다
+    assert first.read_text(encoding="utf-8") == second.read_text(encoding="utf-8") == HTML
+    assert first.stat().st_ino == second.stat().st_ino
+    assert {p.stem for p in day.glob("*.txt")} == {first.stem, second.stem}
+
+
+def test_dedup_falls_back_to_copy_when_link_fails(tmp_path, ingest, monkeypatch):
+    assert ingest() is True
+
+    def no_link(src, dst):
+        raise OSError("cross-device link")
+
+    monkeypatch.setattr(v2.os, "link", no_link)
+    assert ingest() is True
+
+    first, second = sorted(_out_dir(tmp_path).glob("*.txt"), key=lambda p: len(p.name))
+    assert second.read_text(encoding="utf-8") == TEXT
+    assert first.stat().st_ino != second.stat().st_ino
+
+
+def test_dedup_miss_when_previous_file_was_deleted(tmp_path, ingest):
+    assert ingest() is True
+    for p in _out_dir(tmp_path).iterdir():
+        p.unlink()
+
+    assert ingest() is True
+    assert sorted(p.suffix for p in _out_dir(tmp_path).iterdir()) == [".html", ".txt"]
+
+
+def test_same_second_gets_numbered_suffix(tmp_path, monkeypatch):
+    monkeypatch.setattr(v2, "_RAW_ROOT", str(tmp_path))
+    monkeypatch.setattr(v2, "_out_dir_cache", ("", ""))
+    monkeypatch.setattr(v2, "_reserved_bases", set())
+    monkeypatch.setattr(v2, "_reserved_sec", 0)
+    now = [1000.5]
+    monkeypatch.setattr(v2.time, "time", lambda: now[0])
+
+    names = [v2._prepare_output_paths("songpa")[1] for _ in range(3)]
+    assert [p.rsplit("/", 1)[1] for p in names] == ["songpa_1000.html", "songpa_1000_2.html", "songpa_1000_3.html"]
+    # 다른 place는 같은 초라도 접미사 없음
+    assert v2._prepare_output_paths("gangnam")[2].endswith("/gangnam_1000.txt")
+
+    # 초가 바뀌면 예약이 비워진다 (프로세스 수명 동안 쌓이지 않음)
+    now[0] = 1001.0
+    assert v2._prepare_output_paths("songpa")[1].endswith("/songpa_1001.html")
+    assert v2._reserved_bases == {"songpa_1001"}
+
+
+def test_many_logs_exceptions_with_place_and_title(monkeypatch, caplog):
+    async def fake_ingest(place, title, timeout_sec, reuse_browser=True):
+        if place == "nowhere":
+            raise KeyError(place)
+        return True
+
+    monkeypatch.setattr(v2, "arun_ingest_v2", fake_ingest)
+    monkeypatch.setattr(v2, "get_logger", logging.getLogger)
+
+    with caplog.at_level(logging.ERROR):
+        assert v2.run_many_v2([("songpa", "a"), ("nowhere", "b")]) == [True, False]
+    (record,) = caplog.records
+    assert "place=nowhere" in record.getMessage() and "'b'" in record.getMessage()
+    assert record.exc_info[0] is KeyError
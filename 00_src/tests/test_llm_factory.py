@@ -0,0 +1,67 @@
+"""core.llm_factory: settings.toml (경로, mtime) 캐시와 환경변수 스냅샷."""
+
+import os
+
+import pytest
+from core import llm_factory
+
+
+@pytest.fixture
+def settings(tmp_path, monkeypatch):
+    path = tmp_path / "settings.toml"
+    monkeypatch.setattr(llm_factory, "_SETTINGS_TOML", str(path))
+    llm_factory._load_settings_cached.cache_clear()
+    yield path
+    llm_factory._load_settings_cached.cache_clear()
+
+
+def test_missing_settings_uses_default(settings):
+    assert llm_factory._read_settings_model() == llm_factory._DEFAULT_MODEL
+    assert llm_factory._read_settings_model("fallback") == "fallback"
+
+
+def test_settings_parsed_once_while_unchanged(settings):
+    settings.write_text('[llm]\nmodel = "gpt-4o"\n', encoding="utf-8")
+
+    for _ in range(3):
+        assert llm_factory._read_settings_model() == "gpt-4o"
+    info = llm_factory._load_settings_cached.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_modified_settings_are_reread(settings):
+    settings.write_text('[llm]\nmodel = "gpt-4o"\n', encoding="utf-8")
+    assert llm_factory._read_settings_model() == "gpt-4o"
+    mtime_ns = settings.stat().st_mtime_ns
+
+    settings.write_text('[llm]\nmodel = "gpt-5"\n', encoding="utf-8")
+    os.utime(settings, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+    assert llm_factory._read_settings_model() == "gpt-5"
+
+
+def test_broken_settings_use_default(settings):
+    settings.write_text("[llm\nmodel = ", encoding="utf-8")
+    assert llm_factory._read_settings_model() == llm_factory._DEFAULT_MODEL
+
+
+@pytest.fixture
+def env(monkeypatch):
+    for name in ("LLM_MODEL", "LLM_API_KEY", "LLM_BASE_URL"):
+        monkeypatch.delenv(name, raising=False)
+    llm_factory.reset_env_cache()
+    yield monkeypatch
+    llm_factory.reset_env_cache()
+
+
+def test_env_is_snapshotted_until_reset(env):
+    env.setenv("LLM_MODEL", "m1")
+    env.setenv("LLM_API_KEY", "k")
+    assert llm_factory._env_settings() == ("m1", "k", None)
+
+    # 스냅샷 이후 바뀐 환경변수는 reset_env_cache() 전까지 보이지 않는다
+    env.setenv("LLM_MODEL", "m2")
+    env.setenv("LLM_BASE_URL", "http://localhost:1234/v1")
+    assert llm_factory._env_settings() == ("m1", "k", None)
+
+    llm_factory.reset_env_cache()
+    assert llm_factory._env_settings() == ("m2", "k", "http://localhost:1234/v1")
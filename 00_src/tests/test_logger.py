@@ -0,0 +1,50 @@
+"""core.logger: 세션별 로거가 log_dir별 핸들러(graph.log 파일 핸들 하나)를 공유한다."""
+
+import logging
+import uuid
+
+import pytest
+from core import logger as logger_mod
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(logger_mod, "_handlers", {})
+    names = []
+
+    def make(name=None):
+        name = name or f"test_{uuid.uuid4().hex[:8]}"
+        names.append(name)
+        return logger_mod.get_logger(name, log_dir=str(tmp_path))
+
+    yield make
+    for name in names:
+        lg = logging.getLogger(name)
+        for h in lg.handlers[:]:
+            lg.removeHandler(h)
+    for handlers in logger_mod._handlers.values():
+        for h in handlers:
+            h.close()
+
+
+def test_session_loggers_share_handlers(log_dir, tmp_path):
+    a, b = log_dir(), log_dir()
+
+    assert a is not b
+    assert a.handlers == b.handlers
+    assert len(logger_mod._handlers) == 1
+
+    a.info("from %s", "a")
+    b.info("from %s", "b")
+    for h in a.handlers:
+        h.flush()
+    text = (tmp_path / "graph.log").read_text(encoding="utf-8")
+    assert "from a" in text and "from b" in text
+
+
+def test_same_name_does_not_add_handlers_again(log_dir):
+    first = log_dir("test_same_name")
+    again = log_dir("test_same_name")
+
+    assert again is first
+    assert len(first.handlers) == 2  # 파일 + 콘솔
@@ -0,0 +1,108 @@
+"""core.browser_session: 공유 브라우저 기동 락, 독점 사용, 실패한 기동 정리, 종료 시 닫기 (Chromium 없이 가짜 세션으로)."""
+
+import asyncio
+import sys
+import types
+
+import pytest
+from core import async_loop
+from core import browser_session as bs
+
+
+class FakeSession:
+    def __init__(self, keep_alive=True, fail_start=False):
+        self.fail_start = fail_start
+        self.killed = False
+
+    async def start(self):
+        if self.fail_start:
+            raise OSError("chromium did not start")
+
+    async def kill(self):
+        self.killed = True
+
+
+@pytest.fixture(autouse=True)
+def clean_state(monkeypatch):
+    monkeypatch.setattr(bs, "_session", None)
+    monkeypatch.setattr(bs, "_session_loop", None)
+    monkeypatch.setattr(bs, "_atexit_registered", True)  # 테스트에서는 atexit 훅을 등록하지 않는다
+    monkeypatch.setattr(bs, "_BACKOFF_BASE_SEC", 0.0)
+
+
+@pytest.fixture
+def starts(monkeypatch):
+    """_start_with_backoff를 가짜 세션으로 바꾸고, 만든 세션 목록을 돌려준다."""
+    started = []
+
+    async def fake_start():
+        await asyncio.sleep(0.01)  # 기동 중에 다른 호출이 끼어들 틈을 준다
+        started.append(FakeSession())
+        return started[-1]
+
+    async def connected(session):
+        return not session.killed
+
+    monkeypatch.setattr(bs, "_start_with_backoff", fake_start)
+    monkeypatch.setattr(bs, "is_browser_connected", connected)
+    return started
+
+
+def test_concurrent_calls_start_one_browser(starts):
+    async def main():
+        return await asyncio.gather(*(bs.get_shared_browser() for _ in range(5)))
+
+    sessions = asyncio.run(main())
+    assert len(starts) == 1
+    assert all(s is starts[0] for s in sessions)
+
+
+def test_disconnected_session_is_killed_and_replaced(starts):
+    async def main():
+        first = await bs.get_shared_browser()
+        first.killed = True  # 연결 끊김 흉내
+        return first, await bs.get_shared_browser()
+
+    first, second = asyncio.run(main())
+    assert first is not second
+    assert bs._session is second
+
+
+def test_shared_browser_is_used_by_one_caller_at_a_time(starts):
+    events = []
+
+    async def use(name):
+        async with bs.shared_browser():
+            events.append(f"{name}+")
+            await asyncio.sleep(0.01)
+            events.append(f"{name}-")
+
+    async def main():
+        await asyncio.gather(use("a"), use("b"), use("c"))
+
+    asyncio.run(main())
+    assert len(starts) == 1
+    # 진입/이탈이 겹치지 않는다
+    assert all(events[i][0] == events[i + 1][0] for i in range(0, len(events), 2))
+
+
+def test_failed_start_is_killed_before_retry(monkeypatch):
+    made = []
+
+    def factory(keep_alive=True):
+        made.append(FakeSession(fail_start=len(made) == 0))
+        return made[-1]
+
+    monkeypatch.setitem(sys.modules, "browser_use", types.SimpleNamespace(BrowserSession=factory))
+
+    session = asyncio.run(bs._start_with_backoff())
+    assert session is made[1]
+    assert made[0].killed and not made[1].killed
+
+
+def test_close_at_exit_closes_session_on_background_loop(starts):
+    session = async_loop.run(bs.get_shared_browser(), timeout=5)
+
+    bs._close_at_exit()
+    assert session.killed
+    assert bs._session is None
@@ -0,0 +1,65 @@
+"""core.yaml_cache: (경로, mtime, 크기) 캐시와 호출 측 복사본."""
+
+import os
+
+import pytest
+
+pytest.importorskip("yaml")
+
+from core import yaml_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    yaml_cache._load_yaml_cached.cache_clear()
+    yield
+    yaml_cache._load_yaml_cached.cache_clear()
+
+
+def test_returned_value_is_a_copy(tmp_path):
+    path = tmp_path / "c.yaml"
+    path.write_text("songpa:\n  search_box: ['#q']\n", encoding="utf-8")
+
+    first = yaml_cache.load_yaml(str(path))
+    first["songpa"]["search_box"].append("#hacked")
+
+    assert yaml_cache.load_yaml(str(path)) == {"songpa": {"search_box": ["#q"]}}
+    assert yaml_cache._load_yaml_cached.cache_info().misses == 1
+
+
+def test_unchanged_file_is_parsed_once(tmp_path):
+    path = tmp_path / "c.yaml"
+    path.write_text("a: 1\n", encoding="utf-8")
+
+    for _ in range(3):
+        assert yaml_cache.load_yaml(str(path)) == {"a": 1}
+    info = yaml_cache._load_yaml_cached.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_size_change_with_same_mtime_reparses(tmp_path):
+    path = tmp_path / "c.yaml"
+    path.write_text("a: 1\n", encoding="utf-8")
+    assert yaml_cache.load_yaml(str(path)) == {"a": 1}
+    mtime_ns = path.stat().st_mtime_ns
+
+    # mtime 해상도가 거친 파일시스템에서 같은 시각에 다시 저장된 경우
+    path.write_text("a: 22\n", encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    assert yaml_cache.load_yaml(str(path)) == {"a": 22}
+
+
+def test_mtime_change_with_same_size_reparses(tmp_path):
+    path = tmp_path / "c.yaml"
+    path.write_text("a: 1\n", encoding="utf-8")
+    assert yaml_cache.load_yaml(str(path)) == {"a": 1}
+    mtime_ns = path.stat().st_mtime_ns
+
+    path.write_text("a: 2\n", encoding="utf-8")
+    os.utime(path, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+    assert yaml_cache.load_yaml(str(path)) == {"a": 2}
+
+
+def test_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        yaml_cache.load_yaml(str(tmp_path / "nope.yaml"))
@@ -1,34 +1,3 @@
-# # 00_src/core/adapters_manager.py
-# from __future__ import annotations
-# from pathlib import Path
-# from typing import Optional, Dict
-# from urllib.parse import urlparse
-# import yaml
-
-# ROOT = Path(__file__).resolve().parents[1]  # 00_src/
-# ADAPTER_DIR = ROOT / "configs" / "adapters"
-# WHITELIST = ROOT / "configs" / "catalog_whitelist.yaml"
-
-# def load_adapter(domain: str) -> Optional[Dict]:
-#     path = ADAPTER_DIR / f"{domain}".lower() / "noop"  # 도메인 디렉터리 방식도 고려했다가 파일로 고정
-#     # 실제는 파일명.yaml 구조
-#     file_path = ADAPTER_DIR / f"{domain.lower()}.yaml"
-#     if file_path.exists():
-#         return yaml.safe_load(file_path.read_text(encoding="utf-8")) or {}
-#     return None
-
-# def load_whitelist() -> Dict[str, str]:
-#     if WHITELIST.exists():
-#         return yaml.safe_load(WHITELIST.read_text(encoding="utf-8")) or {}
-#     return {}
-
-# def pick_fallback_url(district_slug: str) -> Optional[str]:
-#     wl = load_whitelist()
-#     return wl.get(district_slug, None)
-
-# def domain_from_url(url: str) -> str:
-#     return urlparse(url).netloc.lower()
-
 """
 Adapter & whitelist utility helpers.
 
@@ -39,12 +8,17 @@ Adapter & whitelist utility helpers.
 
 주의:
 - 이 모듈은 네트워크 호출을 하지 않는다. 오로지 파일 로드/파싱만 담당한다.
+- YAML은 (경로, mtime, 크기) 키로 캐시한다. 파싱 결과는 캐시에만 두고, 호출 측에는 깊은 복사본을 준다
+  (render_agent_hint 등이 돌려준 dict를 호출 측이 고쳐도 다음 조회가 오염되지 않게).
 """
 
 from __future__ import annotations
+import copy
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Optional, Dict
 from urllib.parse import urlparse
+import os
 import yaml
 
 # 00_src/
@@ -52,6 +26,21 @@ ROOT = Path(__file__).resolve().parents[1]
 ADAPTER_DIR = ROOT / "configs" / "adapters"
 WHITELIST = ROOT / "configs" / "catalog_whitelist.yaml"
 
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # PyYAML이 libyaml과 빌드됐을 때만 C 로더가 있다
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_Loader)
+
+
+def _load_yaml(path: Path) -> Any:
+    """파일이 그대로면 stat 한 번으로 캐시 재사용, 수정되면 다시 파싱. 없으면 FileNotFoundError.
+    캐시된 객체 대신 깊은 복사본을 돌려준다 (파싱보다 훨씬 싸고, 호출 측이 수정해도 안전)."""
+    st = os.stat(path)
+    return copy.deepcopy(_load_yaml_cached(str(path), st.st_mtime_ns, st.st_size))
+
 
 def load_adapter(domain: str) -> Optional[Dict]:
     """
@@ -63,10 +52,10 @@ def load_adapter(domain: str) -> Optional[Dict]:
     Returns:
         dict | None: YAML 파싱 결과(없으면 None)
     """
-    file_path = ADAPTER_DIR / f"{domain.lower()}.yaml"
-    if file_path.exists():
-        return yaml.safe_load(file_path.read_text(encoding="utf-8")) or {}
-    return None
+    try:
+        return _load_yaml(ADAPTER_DIR / f"{domain.lower()}.yaml") or {}
+    except FileNotFoundError:
+        return None
 
 
 def load_whitelist() -> Dict[str, str]:
@@ -76,9 +65,10 @@ def load_whitelist() -> Dict[str, str]:
     Returns:
         dict: {"gangnam": "https://.../index.do", ...}
     """
-    if WHITELIST.exists():
-        return yaml.safe_load(WHITELIST.read_text(encoding="utf-8")) or {}
-    return {}
+    try:
+        return _load_yaml(WHITELIST) or {}
+    except FileNotFoundError:
+        return {}
 
 
 def pick_fallback_url(district_slug: str) -> Optional[str]:
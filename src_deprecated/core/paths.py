@@ -1,16 +1,19 @@
 # 00_src/core/paths.py
 from __future__ import annotations
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
 import re
 
 ROOT = Path(__file__).resolve().parents[1]  # 00_src/
 RESULT_DIR = ROOT / "data" / "results"
 LOG_RUN_DIR = ROOT / "logs" / "run"
 
+_WS_RE = re.compile(r"\s+")
+_SLUG_UNSAFE_RE = re.compile(r"[^\w\uac00-\ud7a3\-]")
+
 def slug(s: str) -> str:
-    s = re.sub(r"\s+", "", s)  # 공백 제거 (파일명 간결)
-    s = re.sub(r"[^\w\uac00-\ud7a3\-]", "", s)  # 한글/영문/숫자/_/-만
+    s = _WS_RE.sub("", s)  # 공백 제거 (파일명 간결)
+    s = _SLUG_UNSAFE_RE.sub("", s)  # 한글/영문/숫자/_/-만
     return s
 
 def now_kr_iso(compact: bool = True) -> str:
@@ -18,9 +21,12 @@ def now_kr_iso(compact: bool = True) -> str:
     ts = datetime.now().strftime("%Y-%m-%dT%H%M%S" if compact else "%Y-%m-%dT%H:%M:%S")
     return ts
 
+def today_str() -> str:
+    # YYYY-MM-DD. date.isoformat()이 datetime.strftime보다 가볍다 (로케일 포맷 경유 X)
+    return date.today().isoformat()
+
 def dated_dir(base: Path) -> Path:
-    d = datetime.now().strftime("%Y-%m-%d")
-    p = base / d
+    p = base / today_str()
     p.mkdir(parents=True, exist_ok=True)
     return p
 
@@ -15,13 +15,18 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from urllib.parse import urlparse
+import os
 import re
 import json
 
+# YAML 로딩/캐시는 adapters_manager의 것을 같이 쓴다 (PyYAML 필요)
 try:
-    import yaml  # PyYAML (requirements.txt에 추가 권장)
-except Exception:  # yaml이 없으면 어댑터 로딩만 비활성
-    yaml = None
+    from .adapters_manager import _load_yaml
+except ImportError:
+    try:
+        from adapters_manager import _load_yaml  # 스크립트로 직접 실행할 때
+    except ImportError:  # yaml이 없으면 어댑터 로딩만 비활성
+        _load_yaml = None
 
 
 # ====== 경로 기본값 ======
@@ -73,8 +78,8 @@ QUERY_TEMPLATES = [
     "{place} 도서관 {title} site:lib",
 ]
 
-# 결과 구조체
-@dataclass
+# 결과 구조체 (후보 URL마다 하나씩 만들어지므로 slots로 가볍게)
+@dataclass(slots=True)
 class DomainChoice:
     url: str
     domain: str
@@ -85,15 +90,25 @@ class DomainChoice:
 
 # ========== 유틸 ==========
 
+# 정규식은 import 시 한 번만 컴파일 (호출마다 re 모듈 캐시 조회를 거치지 않게)
+_FILENAME_UNSAFE_RE = re.compile(r"[^0-9a-zA-Z._\-\uac00-\ud7a3]")
+
+# 키워드 표도 import 시 한 번만 소문자화: (원래 키워드, 소문자 키워드, 점수)
+# 원래 키워드는 reasons 문구에 그대로 쓴다
+_PATH_KEYWORDS = tuple((kw, kw.lower(), s) for kw, s in SCORES["path_keywords"].items())
+_BAD_INDICATORS = tuple((bad, bad.lower(), s) for bad, s in SCORES["bad_indicators"].items())
+
+
 def _normalize_spaces(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    # str.split()은 정규식 \s와 같은 유니코드 공백 기준으로 C 레벨에서 자른다 (전각 공백 등 포함)
+    return " ".join(text.split())
 
 
 def _slugify_for_filename(text: str) -> str:
     # 파일명에 쓸 수 있게 간단 정규화 (공백->_, 한글/영문/숫자/._-만 허용)
     text = _normalize_spaces(text)
-    text = re.sub(r"\s+", "_", text)
-    text = re.sub(r"[^0-9a-zA-Z._\-\uac00-\ud7a3]", "", text)
+    text = text.replace(" ", "_")  # 정규화 후에는 공백이 단일 ' '뿐
+    text = _FILENAME_UNSAFE_RE.sub("", text)
     return text
 
 
@@ -101,24 +116,19 @@ def _domain_contains(domain: str, token: str) -> bool:
     return token in domain.lower()
 
 
-def _path_contains(path: str, token: str) -> bool:
-    return token.lower() in path.lower()
-
-
 def _load_adapter_for_domain(domain: str) -> Optional[Dict]:
     """
     configs/adapters/{domain}.yaml 파일이 있으면 로드.
     ex) library.gangnam.go.kr.yaml
+    후보 URL마다 불리므로 adapters_manager._load_yaml의 (경로, mtime, 크기) 캐시를 탄다.
+    _load_yaml이 복사본을 주므로 반환값을 고쳐도 캐시는 그대로다. 파일이 없거나 파싱 실패면 None.
     """
-    if yaml is None:
+    if _load_yaml is None:
+        return None
+    try:
+        return _load_yaml(ADAPTER_DIR / f"{domain}.yaml") or {}
+    except Exception:
         return None
-    candidate = ADAPTER_DIR / f"{domain}.yaml"
-    if candidate.exists():
-        try:
-            return yaml.safe_load(candidate.read_text(encoding="utf-8")) or {}
-        except Exception:
-            return None
-    return None
 
 
 # ========== 핵심 로직 ==========
@@ -127,15 +137,8 @@ def build_search_queries(place: str, title: str) -> List[str]:
     """장소+제목으로 다양한 쿼리 문자열 생성."""
     place = _normalize_spaces(place)
     title = _normalize_spaces(title)
-    queries = [tpl.format(place=place, title=title) for tpl in QUERY_TEMPLATES]
-    # 중복 제거 유지순서
-    seen = set()
-    uniq = []
-    for q in queries:
-        if q not in seen:
-            uniq.append(q)
-            seen.add(q)
-    return uniq
+    # 중복 제거 유지순서 (dict.fromkeys: 삽입 순서 보존, C 레벨 루프)
+    return list(dict.fromkeys(tpl.format(place=place, title=title) for tpl in QUERY_TEMPLATES))
 
 
 def score_candidate_url(url: str, title: str) -> Tuple[float, List[str]]:
@@ -156,20 +159,21 @@ def score_candidate_url(url: str, title: str) -> Tuple[float, List[str]]:
                 score += s
                 reasons.append(f"+{s} domain has '{suffix}'")
 
-        # 경로/쿼리 키워드 가산점
-        for kw, s in SCORES["path_keywords"].items():
-            if _path_contains(path_q, kw):
+        # 경로/쿼리 키워드 가산점 (path_q와 키워드 모두 이미 소문자)
+        for kw, kw_l, s in _PATH_KEYWORDS:
+            if kw_l in path_q:
                 score += s
                 reasons.append(f"+{s} path contains '{kw}'")
 
         # 불량 지표 감점
-        for bad, s in SCORES["bad_indicators"].items():
-            if bad in domain or _path_contains(path_q, bad):
+        for bad, bad_l, s in _BAD_INDICATORS:
+            if bad in domain or bad_l in path_q:
                 score += s
                 reasons.append(f"{s} bad indicator '{bad}'")
 
-        # 제목 일부가 URL에 보이면 소폭 가산
-        if any(tok for tok in title.split() if tok and tok.lower() in url.lower()):
+        # 제목 일부가 URL에 보이면 소폭 가산 (URL은 한 번만 소문자화, 첫 일치에서 중단)
+        url_l = url.lower()
+        if any(tok.lower() in url_l for tok in title.split()):
             score += SCORES["title_bonus_if_contains"]
             reasons.append(f"+{SCORES['title_bonus_if_contains']} title token appears in URL")
 
@@ -198,9 +202,9 @@ def choose_best_domain(
             base_score += SCORES["adapter_bonus"]
             reasons.append(f"+{SCORES['adapter_bonus']} adapter exists for {domain}")
 
-        choice = DomainChoice(url=url, domain=domain, score=base_score, reason=reasons, adapter=adapter)
-        if (best is None) or (choice.score > best.score):
-            best = choice
+        # 최고점을 갱신할 때만 결과 객체를 만든다
+        if (best is None) or (base_score > best.score):
+            best = DomainChoice(url=url, domain=domain, score=base_score, reason=reasons, adapter=adapter)
 
     return best
 
@@ -243,26 +247,6 @@ def render_agent_hint(choice: DomainChoice) -> Dict:
     return hint
 
 
-# def build_policy(place: str, title: str, engine_order: Optional[List[str]] = None) -> Dict:
-#     """
-#     browser-use 상위 레이어가 호출하는 진입점:
-#     - 검색 쿼리 리스트
-#     - 엔진 우선순위
-#     - URL 후보 선택을 위한 스코어링 규칙 안내(문서용)
-#     """
-#     queries = build_search_queries(place, title)
-#     engines = engine_order or ["duckduckgo", "google", "bing"]
-#     return {
-#         "queries": queries,
-#         "engines": engines,
-#         "scoring_rules": {
-#             "domain_suffix": SCORES["domain_suffix"],
-#             "path_keywords": SCORES["path_keywords"],
-#             "bad_indicators": SCORES["bad_indicators"],
-#             "adapter_bonus": SCORES["adapter_bonus"],
-#         },
-#     }
-
 def build_policy(place: str, title: str, engine_order: Optional[List[str]] = None) -> Dict:
     """
     browser-use 상위 레이어가 호출하는 진입점:
@@ -284,11 +268,12 @@ def build_policy(place: str, title: str, engine_order: Optional[List[str]] = Non
         },
     }
 
-print("ADAPTER_DIR =", ADAPTER_DIR.resolve())
-print("EXPECT_FILE =", (ADAPTER_DIR / "library.gangnam.go.kr.yaml").resolve())
-print("EXISTS?     =", (ADAPTER_DIR / "library.gangnam.go.kr.yaml").exists())
+# 어댑터 경로 진단 출력: import 때마다 resolve/stat + stdout 출력이 나가지 않도록 DEBUG일 때만
+if os.environ.get("DEBUG"):
+    print("ADAPTER_DIR =", ADAPTER_DIR.resolve())
+    print("EXPECT_FILE =", (ADAPTER_DIR / "library.gangnam.go.kr.yaml").resolve())
+    print("EXISTS?     =", (ADAPTER_DIR / "library.gangnam.go.kr.yaml").exists())
 
-# ====== (선택) 간단한 수동 테스트용 ======
 # ====== (선택) 간단한 수동 테스트용 ======
 if __name__ == "__main__":
     """